@@ -0,0 +1,778 @@
+import sys
+
+from deduplication import duplicate_checker
+from doubly_linked_list import DoublyLinkedList, Node
+from memory_profiling import deep_getsizeof, node_overhead
+from singly_linked_list import LinkedList
+
+
+class AdaptiveSequence:
+    '''
+    Represents a sequence that switches between an array and a doubly linked list depending on its workload.
+
+    The sequence holds doubly linked list nodes in both representations, so methods that return nodes
+    behave the same way in both. In the array representation the next and prev references of the nodes are None.
+
+    Every positional operation (indexed gets and sets, middle inserts and pops, pushes and pops at either end)
+    is charged to both representations with a cost model. The initial values are not charged. Every sample_interval operations, the excess cost of
+    the current representation over the other is accumulated; once it exceeds the cost of migrating all nodes,
+    the sequence migrates. Costs are expressed in node hops, and the constants below were measured on CPython.
+
+    Lookups by value (find, access and the in operator) are not charged, since they scan both representations
+    alike. They apply the self-organizing policy of the sequence in either representation, like DoublyLinkedList.
+
+    Attributes:
+        representation: The current representation, one of REPRESENTATIONS.
+        adaptive: Whether the sequence migrates on its own.
+        sample_interval: The number of positional operations between two migration decisions.
+        length: The number of nodes in the sequence.
+        migrations: The migration decisions taken so far.
+        policy: The self-organizing policy applied on lookups, one of DoublyLinkedList.POLICIES, or None.
+    '''
+    REPRESENTATIONS = ('array', 'linked')
+
+    NODE_HOP_COST = 1
+    ARRAY_OP_COST = 2
+    LINKED_OP_COST = 20
+    ARRAY_SHIFT_COST = 0.015
+    MIGRATION_COST = 25
+
+    def __init__(self, *args, representation='array', adaptive=True, sample_interval=256, policy=None):
+        '''
+        Initializes a new instance of the AdaptiveSequence class.
+
+        Parameters:
+            *args (optional): Variable number of values or node instances to initialize the sequence.
+                If a node instance is provided, it will be appended directly.
+                If a raw value is provided, a node will be created for it and appended to the sequence.
+            representation (str, optional): The initial representation. Defaults to 'array'.
+            adaptive (bool, optional): Whether the sequence migrates on its own. Defaults to True.
+            sample_interval (int, optional): The number of positional operations between two migration
+                decisions. Defaults to 256.
+            policy (str, optional): The self-organizing policy applied when a value is looked up,
+                as for DoublyLinkedList. Defaults to None, which never reorders the nodes.
+
+        Raises:
+            ValueError: If a value is None, the representation is not one of REPRESENTATIONS,
+                sample_interval is not positive, or the policy is not one of DoublyLinkedList.POLICIES.
+        '''
+        if representation not in self.REPRESENTATIONS:
+            raise ValueError(f"Unknown representation {representation}. Expected one of {self.REPRESENTATIONS}")
+
+        if sample_interval <= 0:
+            raise ValueError("Sample interval must be positive")
+
+        if policy is not None and policy not in DoublyLinkedList.POLICIES:
+            raise ValueError(f"Unknown policy {policy}. Expected one of {DoublyLinkedList.POLICIES}")
+
+        self.representation = representation
+        self.adaptive = adaptive
+        self.sample_interval = sample_interval
+        self.migrations = []
+        self.policy = policy
+        self._store = [] if representation == 'array' else DoublyLinkedList(policy=policy)
+        self._access_counts = {}
+        self._operations = 0
+        self._window = {}
+        self._array_cost = 0
+        self._linked_cost = 0
+        self._pressure = 0
+
+        # The initial values are loaded without being charged, so they do not skew the first windows.
+        nodes = [arg if isinstance(arg, Node) else Node(arg) for arg in args]
+        if representation == 'linked':
+            for node in nodes:
+                self._store.append_node(node)
+        else:
+            self._store = nodes
+
+    @property
+    def length(self):
+        '''
+        Returns the number of nodes in the sequence.
+
+        Returns:
+            int: The number of nodes in the sequence.
+        '''
+        return len(self._store)
+
+    @property
+    def head(self):
+        '''
+        Returns the first node of the sequence, or None if it is empty.
+
+        Returns:
+            node: The first node in the sequence.
+        '''
+        if self.representation == 'linked':
+            return self._store.head
+        return self._store[0] if self._store else None
+
+    @property
+    def tail(self):
+        '''
+        Returns the last node of the sequence, or None if it is empty.
+
+        Returns:
+            node: The last node in the sequence.
+        '''
+        if self.representation == 'linked':
+            return self._store.tail
+        return self._store[-1] if self._store else None
+
+    def __str__(self):
+        '''
+        Returns a string representation of the sequence.
+
+        Returns:
+            str: String representation of the sequence.
+        '''
+        if self.representation == 'linked':
+            return str(self._store)
+        return ' <=> '.join(str(node) for node in self._store)
+
+    def __contains__(self, value):
+        '''
+        Check if the sequence contains the given value.
+
+        Parameters:
+            value: The value to search for in the sequence.
+
+        Returns:
+            bool: True if the value is found in the sequence, False otherwise.
+        '''
+        return self.find(value) != -1
+
+    def __getitem__(self, index):
+        '''
+        Returns the node at the given index.
+
+        Parameters:
+            index: The index of the node in the sequence.
+
+        Returns:
+            node: The node at the given index.
+
+        Raises:
+            IndexError: If the index is out of range.
+        '''
+        return self.get(index)
+
+    def __setitem__(self, index, value):
+        '''
+        Set the value of the node at the given index.
+
+        Parameters:
+            index: The index of the node in the sequence.
+            value: The value to give the node at the given index.
+
+        Raises:
+            IndexError: If the index is out of range.
+        '''
+        self.get(index).value = value
+
+    def __iter__(self):
+        '''
+        Returns an iterator over the values of the sequence.
+        Every call returns an independent iterator in both representations, so the sequence can be iterated in nested loops.
+
+        Returns:
+            iterator: An iterator over the values of the sequence.
+        '''
+        if self.representation == 'linked':
+            return iter(self._store)
+        return (node.value for node in self._store)
+
+    def __len__(self):
+        '''
+        Returns the length of the sequence.
+
+        Returns:
+            int: Length of the sequence.
+        '''
+        return len(self._store)
+
+    def _costs(self, operation, index):
+        '''
+        Returns the estimated cost of the operation at the given index for the array and the linked representation.
+        '''
+        length = len(self._store)
+
+        if operation == 'get':
+            hops = min(index, length - index - 1)
+            return self.ARRAY_OP_COST, self.LINKED_OP_COST + self.NODE_HOP_COST * hops
+        if operation in ('insert', 'pop'):
+            hops = min(index, length - index)
+            return (self.ARRAY_OP_COST + self.ARRAY_SHIFT_COST * (length - index),
+                    self.LINKED_OP_COST + self.NODE_HOP_COST * hops)
+        if operation in ('push_front', 'pop_front'):
+            return self.ARRAY_OP_COST + self.ARRAY_SHIFT_COST * length, self.LINKED_OP_COST
+        if operation == 'unlink':
+            return self.ARRAY_OP_COST + self.ARRAY_SHIFT_COST * (length - index), self.LINKED_OP_COST
+        return self.ARRAY_OP_COST, self.LINKED_OP_COST
+
+    def _record(self, operation, index=0):
+        '''
+        Charges a positional operation to both representations, and decides on a migration every sample_interval operations.
+        '''
+        array_cost, linked_cost = self._costs(operation, index)
+        self._array_cost += array_cost
+        self._linked_cost += linked_cost
+        self._window[operation] = self._window.get(operation, 0) + 1
+        self._operations += 1
+
+        if self._operations % self.sample_interval:
+            return
+
+        if self.representation == 'array':
+            excess = self._array_cost - self._linked_cost
+        else:
+            excess = self._linked_cost - self._array_cost
+        self._pressure = max(0, self._pressure + excess)
+
+        if self.adaptive and self._pressure > self.MIGRATION_COST * len(self._store):
+            target = 'linked' if self.representation == 'array' else 'array'
+            self._migrate(target, forced=False)
+
+        self._window = {}
+        self._array_cost = 0
+        self._linked_cost = 0
+
+    def _migrate(self, target, forced):
+        '''
+        Moves every node to the target representation and records the decision.
+        '''
+        self.migrations.append({
+            'operation': self._operations,
+            'source': self.representation,
+            'target': target,
+            'length': len(self._store),
+            'forced': forced,
+            'window': dict(self._window),
+            'array_cost': self._array_cost,
+            'linked_cost': self._linked_cost,
+        })
+
+        # The access counts of the 'count' policy move along with the nodes.
+        if target == 'linked':
+            linked_list = DoublyLinkedList(policy=self.policy)
+            for node in self._store:
+                linked_list.append_node(node)
+            linked_list._access_counts, self._access_counts = self._access_counts, {}
+            self._store = linked_list
+        else:
+            self._access_counts, self._store._access_counts = self._store._access_counts, {}
+            nodes = []
+            while self._store.head:
+                nodes.append(self._store.pop_first())
+            self._store = nodes
+
+        self.representation = target
+        self._pressure = 0
+
+    def migrate(self, representation):
+        '''
+        Moves the sequence to the given representation, regardless of the cost model.
+
+        Parameters:
+            representation: The target representation, one of REPRESENTATIONS.
+
+        Raises:
+            ValueError: If the representation is not one of REPRESENTATIONS.
+        '''
+        if representation not in self.REPRESENTATIONS:
+            raise ValueError(f"Unknown representation {representation}. Expected one of {self.REPRESENTATIONS}")
+
+        if representation != self.representation:
+            self._migrate(representation, forced=True)
+
+    def stats(self):
+        '''
+        Returns the sampling and migration statistics of the sequence.
+
+        Returns:
+            dict: The statistics, holding:
+                representation: The current representation.
+                operations: The number of positional operations recorded so far.
+                window: The number of operations per kind in the current sampling window. The kinds are
+                    'get', 'insert', 'pop', 'unlink', 'push_front', 'push_back', 'pop_front' and 'pop_back'.
+                array_cost: The estimated cost of the current window for the array representation.
+                linked_cost: The estimated cost of the current window for the linked representation.
+                pressure: The accumulated excess cost of the current representation.
+                migrations: The migration decisions taken so far.
+        '''
+        return {
+            'representation': self.representation,
+            'operations': self._operations,
+            'window': dict(self._window),
+            'array_cost': self._array_cost,
+            'linked_cost': self._linked_cost,
+            'pressure': self._pressure,
+            'migrations': list(self.migrations),
+        }
+
+    def _normalize_index(self, index):
+        '''
+        Returns the non-negative equivalent of the given index.
+
+        Raises:
+            IndexError: If the index is out of range.
+        '''
+        length = len(self._store)
+        if index >= length or index < -length:
+            raise IndexError("Index out of range")
+        return index + length if index < 0 else index
+
+    def append_node(self, node):
+        '''
+        Appends a node to the end of the sequence.
+
+        Parameters:
+            node: The node to append to the sequence.
+
+        Raises:
+            TypeError: If the argument is not of type: Node.
+        '''
+        if not isinstance(node, Node):
+            raise TypeError("Invalid node type. Expected Node instance.")
+
+        self._record('push_back')
+        if self.representation == 'linked':
+            self._store.append_node(node)
+        else:
+            self._store.append(node)
+
+    def append(self, value):
+        '''
+        Appends a new node with the given value to the end of the sequence.
+
+        Parameters:
+            value: The value to be stored in the new node.
+        '''
+        self.append_node(Node(value))
+
+    def prepend(self, value):
+        '''
+        Prepends a new node with the given value to the beginning of the sequence.
+
+        Parameters:
+            value: The value to be stored in the new node.
+        '''
+        self._record('push_front')
+        if self.representation == 'linked':
+            self._store.prepend(value)
+        else:
+            self._store.insert(0, Node(value))
+
+    def insert(self, index, value):
+        '''
+        Inserts a new node with the given value to the sequence at the given index.
+        Like DoublyLinkedList, a negative index counts insert positions from the end, so -1 appends.
+
+        Parameters:
+            index: The index the new node will be inserted at.
+            value: The value to be stored in the new node.
+
+        Raises:
+            ValueError: If index is out of range.
+        '''
+        length = len(self._store)
+        if index < -(length+1) or index > length:
+            raise ValueError("Index out of range")
+
+        if index < 0:
+            index += length + 1
+
+        if index == 0:
+            self.prepend(value)
+        elif index == length:
+            self.append(value)
+        else:
+            self._record('insert', index)
+            if self.representation == 'linked':
+                self._store.insert(index, value)
+            else:
+                self._store.insert(index, Node(value))
+
+    def find(self, value):
+        '''
+        Searches for the given value in the sequence and returns the index of the first occurrence.
+
+        Parameters:
+            value: The value to search for in the sequence.
+
+        Returns:
+            index: The index of the first occurrence of the value. If the value is not found, returns -1.
+        '''
+        if self.representation == 'linked':
+            return self._store.find(value)
+        return self._search(value)[0]
+
+    def _index_of(self, value):
+        '''
+        Returns the index of the first node with the given value in the array representation, or -1.
+        '''
+        for index, node in enumerate(self._store):
+            if node.value == value:
+                return index
+        return -1
+
+    def _search(self, value):
+        '''
+        Returns the index and the node of the first occurrence of the value in the array representation,
+        or (-1, None) if it is not found. The found node is moved according to the policy of the sequence.
+        '''
+        store = self._store
+        index = self._index_of(value)
+        if index == -1:
+            return -1, None
+
+        node = store[index]
+
+        if self.policy == 'count':
+            count = self._access_counts.get(node, 0) + 1
+            self._access_counts[node] = count
+
+        if self.policy is None or index == 0:
+            return index, node
+
+        if self.policy == 'move_to_front':
+            target = 0
+        elif self.policy == 'transpose':
+            target = index - 1
+        else:
+            target = index
+            while target > 0 and self._access_counts.get(store[target - 1], 0) < count:
+                target -= 1
+
+        if target != index:
+            del store[index]
+            store.insert(target, node)
+
+        return index, node
+
+    def access(self, value):
+        '''
+        Returns the first node with the given value, reordering the sequence according to its policy.
+
+        Parameters:
+            value: The value to search for in the sequence.
+
+        Returns:
+            node: The first node with the given value.
+
+        Raises:
+            ValueError: If the value is not found in the sequence.
+        '''
+        if self.representation == 'linked':
+            return self._store.access(value)
+
+        node = self._search(value)[1]
+        if node is None:
+            raise ValueError(f"Value {value} not found in the sequence")
+        return node
+
+    def get(self, index):
+        '''
+        Returns the node located at the given index.
+
+        Parameters:
+            index: The index of the node in the sequence.
+
+        Returns:
+            node: The node located at the given index.
+
+        Raises:
+            IndexError: If the index is out of range.
+        '''
+        index = self._normalize_index(index)
+        self._record('get', index)
+
+        if self.representation == 'linked':
+            return self._store.get(index)
+        return self._store[index]
+
+    def set_value(self, index, value):
+        '''
+        Sets the given value to the node located at the given index.
+
+        Parameters:
+            index: The index of the node in the sequence.
+            value: The value to give the node.
+
+        Raises:
+            IndexError: If the index is out of range.
+        '''
+        self.get(index).value = value
+
+    def pop_first(self):
+        '''
+        Removes first node from the sequence and returns the node.
+
+        Returns:
+            node: The removed node which was located at index 0.
+        Raises:
+            IndexError: If the sequence is empty and there are no nodes to pop.
+        '''
+        if not self._store:
+            raise IndexError("Cannot pop from an empty sequence")
+
+        self._record('pop_front')
+        if self.representation == 'linked':
+            return self._store.pop_first()
+
+        node = self._store.pop(0)
+        self._access_counts.pop(node, None)
+        return node
+
+    def pop(self, index=None):
+        '''
+        Removes and returns the node at the specified index, or the last node if index is not provided.
+
+        Parameters:
+            index (int, optional): The index of the node to remove. If not provided, the last node is removed. Defaults to None.
+
+        Returns:
+            node: The removed node.
+
+        Raises:
+            IndexError: If the sequence is empty.
+            IndexError: If the provided index is out of range.
+        '''
+        if not self._store:
+            raise IndexError("Cannot pop from an empty sequence")
+
+        index = len(self._store) - 1 if index is None else self._normalize_index(index)
+
+        if index == 0:
+            return self.pop_first()
+
+        if index == len(self._store) - 1:
+            self._record('pop_back')
+        else:
+            self._record('pop', index)
+
+        node = self._store.pop(index)
+        self._access_counts.pop(node, None)
+        return node
+
+    def remove(self, value):
+        '''
+        Removes the first occurrence of a node with the given value from the sequence.
+
+        Parameters:
+            value: The value of the node to remove from the sequence.
+
+        Returns:
+            node: The removed node.
+
+        Raises:
+            ValueError: If the value is not found in the sequence.
+        '''
+        if self.representation == 'linked':
+            # The position is unknown without a second walk, so the middle is charged.
+            node = self._store.remove(value)
+            self._record('unlink', len(self._store) // 2)
+            return node
+
+        index = self._index_of(value)
+        if index == -1:
+            raise ValueError(f"Value {value} not found in the sequence")
+
+        self._record('unlink', index)
+        node = self._store.pop(index)
+        self._access_counts.pop(node, None)
+        return node
+
+    def remove_if(self, predicate):
+        '''
+        Removes every node whose value satisfies the given predicate, in a single traversal.
+
+        Parameters:
+            predicate: A function taking a value and returning True if its node should be removed.
+
+        Returns:
+            DoublyLinkedList: The removed nodes, relinked in their original order. No new nodes are allocated.
+        '''
+        if self.representation == 'linked':
+            return self._store.remove_if(predicate)
+
+        removed = DoublyLinkedList()
+        kept = []
+
+        for node in self._store:
+            if predicate(node.value):
+                removed.append_node(node)
+                self._access_counts.pop(node, None)
+            else:
+                kept.append(node)
+
+        self._store = kept
+        return removed
+
+    def remove_all(self, value):
+        '''
+        Removes every node with the given value, in a single traversal.
+
+        Parameters:
+            value: The value of the nodes to remove from the sequence.
+
+        Returns:
+            int: The number of removed nodes.
+        '''
+        return len(self.remove_if(lambda node_value: node_value == value))
+
+    def discard_many(self, values):
+        '''
+        Removes every node whose value is one of the given values, in a single traversal.
+        Values that are not in the sequence are ignored.
+
+        Parameters:
+            values: An iterable of the values to remove from the sequence.
+
+        Returns:
+            int: The number of removed nodes.
+        '''
+        values = list(values)
+        try:
+            values = set(values)
+        except TypeError:
+            pass
+
+        return len(self.remove_if(lambda node_value: node_value in values))
+
+    def remove_duplicates(self, key=None, approximate=False, error_rate=0.01, max_bytes=None):
+        '''
+        Removes nodes with duplicate values from the sequence, keeping only the first occurrence of each value.
+        See DoublyLinkedList.remove_duplicates for the parameters.
+
+        Returns:
+            int: The number of removed nodes.
+
+        Raises:
+            RuntimeError: If the sequence is empty.
+        '''
+        if not self._store:
+            raise RuntimeError("Cannot remove duplicates from an empty sequence")
+
+        is_duplicate = duplicate_checker(len(self._store), key, approximate, error_rate, max_bytes)
+
+        return len(self.remove_if(is_duplicate))
+
+    def unique(self, key=None, approximate=False, error_rate=0.01, max_bytes=None):
+        '''
+        Yields the values of the sequence, skipping values whose key was already yielded.
+        See DoublyLinkedList.unique for the parameters.
+
+        Yields:
+            value: The first value of every distinct key, in order.
+        '''
+        is_duplicate = duplicate_checker(len(self._store), key, approximate, error_rate, max_bytes)
+
+        for value in self:
+            if not is_duplicate(value):
+                yield value
+
+    def reverse(self):
+        '''
+        Reverses the order of the nodes in the sequence. Constant time in the linked representation.
+        '''
+        self._store.reverse()
+
+    def reversed_copy(self):
+        '''
+        Returns a new sequence holding the values of this sequence in reverse order, in the same representation.
+
+        Returns:
+            AdaptiveSequence: A new sequence with new nodes in reverse order.
+        '''
+        values = list(self)
+        values.reverse()
+        return AdaptiveSequence(*values, representation=self.representation, adaptive=self.adaptive,
+                                sample_interval=self.sample_interval, policy=self.policy)
+
+    def reverse_range(self, start, stop):
+        '''
+        Reverses, in place, the nodes from index start up to but not including index stop.
+
+        Parameters:
+            start: The index of the first node to reverse.
+            stop: The index after the last node to reverse.
+
+        Raises:
+            IndexError: If start or stop is out of range.
+            ValueError: If start is greater than stop.
+        '''
+        if self.representation == 'linked':
+            self._store.reverse_range(start, stop)
+            return
+
+        length = len(self._store)
+        if start < 0:
+            start += length
+        if stop < 0:
+            stop += length
+
+        if start < 0 or stop < 0 or start > length or stop > length:
+            raise IndexError("Index out of range")
+
+        if start > stop:
+            raise ValueError("Start index cannot be greater than stop index")
+
+        self._store[start:stop] = self._store[start:stop][::-1]
+
+    def merge(self, sequence):
+        '''
+        Merge the values of another sequence to the end of this sequence. New nodes are created for them.
+
+        Raises:
+            TypeError: If argument is not of type LinkedList, DoublyLinkedList or AdaptiveSequence.
+            RuntimeError: If argument sequence is empty.
+        '''
+        if not isinstance(sequence, (LinkedList, DoublyLinkedList, AdaptiveSequence)):
+            raise TypeError("Argument must be of type LinkedList, DoublyLinkedList or AdaptiveSequence")
+
+        if not len(sequence):
+            raise RuntimeError("The given sequence cannot be empty")
+
+        for value in list(sequence):
+            self.append(value)
+
+    def memory_usage(self, deep=False):
+        '''
+        Returns a report of the memory used by the sequence, in the same format as DoublyLinkedList.memory_usage.
+        In the array representation, list holds the sequence object, its array of node references and its access counts.
+
+        Parameters:
+            deep (bool, optional): Whether to include the deep size of the stored values. Defaults to False.
+
+        Returns:
+            dict: The report, with an additional representation entry.
+        '''
+        if self.representation == 'linked':
+            report = self._store.memory_usage(deep)
+            own_size = sys.getsizeof(self) + sys.getsizeof(vars(self))
+            report['list'] += own_size
+            report['total'] += own_size
+        else:
+            list_size = (sys.getsizeof(self) + sys.getsizeof(vars(self)) + sys.getsizeof(self._store)
+                         + sys.getsizeof(self._access_counts))
+            node = node_overhead(Node)
+            nodes_size = node['total'] * len(self._store)
+
+            values_size = None
+            if deep:
+                seen = set()
+                values_size = sum(deep_getsizeof(node.value, seen) for node in self._store)
+
+            report = {
+                'length': len(self._store),
+                'list': list_size,
+                'node': node,
+                'nodes': nodes_size,
+                'values': values_size,
+                'total': list_size + nodes_size + (values_size or 0),
+            }
+
+        report['representation'] = self.representation
+        return report
@@ -0,0 +1,72 @@
+'''
+Runs a phase-changing workload on AdaptiveSequence, and on the same type pinned to each representation.
+
+Run from the repository root:
+    python -m benchmarks.adaptive_benchmark
+'''
+import random
+import time
+
+from adaptive_sequence import AdaptiveSequence
+
+SIZE = 20_000
+OPERATIONS = 20_000
+
+
+def indexed_gets(sequence):
+    for _ in range(OPERATIONS):
+        sequence.get(random.randrange(len(sequence)))
+
+
+def queue(sequence):
+    for value in range(OPERATIONS):
+        sequence.append(value)
+        sequence.pop_first()
+
+
+def deque(sequence):
+    for value in range(OPERATIONS):
+        sequence.prepend(value)
+        sequence.pop()
+
+
+PHASES = (
+    ('indexed gets', indexed_gets),
+    ('queue', queue),
+    ('indexed gets', indexed_gets),
+    ('deque', deque),
+)
+
+
+def main():
+    variants = {
+        'adaptive': {},
+        'pinned array': {'representation': 'array', 'adaptive': False},
+        'pinned linked': {'representation': 'linked', 'adaptive': False},
+    }
+
+    print(f'{SIZE} values, {OPERATIONS} operations per phase')
+    print(f"{'variant':<16}" + ''.join(f'{name:>15}' for name, _ in PHASES) + f"{'total':>10}")
+    adaptive_sequence = None
+    for variant, options in variants.items():
+        random.seed(0)
+        sequence = AdaptiveSequence(*range(SIZE), **options)
+        timings = []
+        for _, phase in PHASES:
+            start = time.perf_counter()
+            phase(sequence)
+            timings.append(time.perf_counter() - start)
+        print(f'{variant:<16}' + ''.join(f'{timing:>15.3f}' for timing in timings) + f'{sum(timings):>10.3f}')
+        if variant == 'adaptive':
+            adaptive_sequence = sequence
+
+    print()
+    print('Migrations of the adaptive sequence:')
+    for migration in adaptive_sequence.stats()['migrations']:
+        print(f"  after {migration['operation']} operations: {migration['source']} -> {migration['target']}"
+              f" (window {migration['window']}, array cost {migration['array_cost']:.0f},"
+              f" linked cost {migration['linked_cost']:.0f})")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,84 @@
+'''
+Compares memory and throughput of exact and approximate deduplication on a high-cardinality list.
+
+The baseline is the set-of-values algorithm remove_duplicates used before it supported keys and Bloom filters.
+
+Run from the repository root:
+    python -m benchmarks.dedup_benchmark
+'''
+import random
+import time
+import tracemalloc
+
+from singly_linked_list import LinkedList
+
+SIZE = 200_000
+DISTINCT = 150_000
+
+
+def baseline_remove_duplicates(linked_list):
+    '''
+    The previous remove_duplicates implementation, kept for comparison.
+    '''
+    seen = set()
+    current = linked_list.head
+    seen.add(current.value)
+
+    while current.next:
+        if current.next.value in seen:
+            current.next = current.next.next
+            linked_list.length -= 1
+        else:
+            seen.add(current.next.value)
+            current = current.next
+
+    linked_list.tail = current
+    return len(linked_list)
+
+
+def measure(values, deduplicate):
+    '''
+    Returns the elapsed seconds, the traced peak in bytes above the list itself, and the number of kept values.
+    Timing and tracing use separate runs, since tracemalloc slows down allocation-heavy code unevenly.
+    '''
+    linked_list = LinkedList(*values)
+    start = time.perf_counter()
+    kept = deduplicate(linked_list)
+    elapsed = time.perf_counter() - start
+
+    linked_list = LinkedList(*values)
+    tracemalloc.start()
+    try:
+        deduplicate(linked_list)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return elapsed, peak, kept
+
+
+def main():
+    random.seed(0)
+    values = [random.randrange(DISTINCT) for _ in range(SIZE)]
+    expected = len(set(values))
+
+    cases = {
+        'baseline set': baseline_remove_duplicates,
+        'exact': lambda linked_list: SIZE - linked_list.remove_duplicates(),
+        'bloom 1%': lambda linked_list: SIZE - linked_list.remove_duplicates(approximate=True, error_rate=0.01),
+        'bloom 0.1%': lambda linked_list: SIZE - linked_list.remove_duplicates(approximate=True, error_rate=0.001),
+        'bloom 64 KiB cap': lambda linked_list: SIZE - linked_list.remove_duplicates(approximate=True, max_bytes=64 * 1024),
+        'unique() exact': lambda linked_list: sum(1 for _ in linked_list.unique()),
+        'unique() bloom 1%': lambda linked_list: sum(1 for _ in linked_list.unique(approximate=True)),
+    }
+
+    print(f'{SIZE} values, {expected} distinct')
+    print(f"{'mode':<20}{'seconds':>10}{'Mvalues/s':>12}{'peak KiB':>12}{'wrongly dropped':>18}")
+    for name, deduplicate in cases.items():
+        elapsed, peak, kept = measure(values, deduplicate)
+        dropped = expected - kept
+        print(f'{name:<20}{elapsed:>10.3f}{SIZE / elapsed / 1e6:>12.2f}{peak / 1024:>12.1f}{dropped:>18}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,57 @@
+'''
+Measures the bytes per element of each node representation, next to a plain Python list.
+
+Run from the repository root:
+    python -m benchmarks.memory_benchmark
+'''
+import tracemalloc
+
+from doubly_linked_list import DoublyLinkedList
+from memory_profiling import AllocationProfiler
+from singly_linked_list import LinkedList
+
+SIZES = (1_000, 10_000, 100_000)
+
+
+def traced_bytes(build):
+    '''
+    Returns the bytes still allocated after calling build, together with the built object.
+    '''
+    tracemalloc.start()
+    try:
+        before, _ = tracemalloc.get_traced_memory()
+        built = build()
+        after, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return after - before, built
+
+
+def main():
+    builders = {
+        'list': lambda n: list(range(n)),
+        'LinkedList': lambda n: LinkedList(*range(n)),
+        'DoublyLinkedList': lambda n: DoublyLinkedList(*range(n)),
+    }
+
+    print(f"{'structure':<18}{'size':>10}{'traced B/elem':>16}{'reported B/elem':>18}")
+    for name, build in builders.items():
+        for size in SIZES:
+            traced, built = traced_bytes(lambda: build(size))
+            reported = built.memory_usage(deep=True)['total'] / size if hasattr(built, 'memory_usage') else float('nan')
+            print(f'{name:<18}{size:>10}{traced / size:>16.1f}{reported:>18.1f}')
+
+    print()
+    print('Allocations per method (LinkedList, 10000 elements):')
+    linked_list = LinkedList()
+    with AllocationProfiler(linked_list) as profiler:
+        for value in range(10_000):
+            linked_list.append(value)
+        linked_list.reversed_copy()
+        linked_list.reverse()
+    for method, stats in profiler.report():
+        print(f"  {method:<16}calls={stats['calls']:<8}allocated={stats['allocated']:<10}peak={stats['peak']}")
+
+
+if __name__ == '__main__':
+    main()
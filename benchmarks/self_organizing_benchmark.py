@@ -0,0 +1,51 @@
+'''
+Compares the average scan depth and lookup latency of the self-organizing policies on a Zipf-distributed workload.
+
+Run from the repository root:
+    python -m benchmarks.self_organizing_benchmark
+'''
+import itertools
+import random
+import time
+
+from doubly_linked_list import DoublyLinkedList
+from singly_linked_list import LinkedList
+
+SIZE = 2_000
+LOOKUPS = 20_000
+ZIPF_EXPONENT = 1.1
+
+
+def zipf_workload(size, lookups, exponent):
+    '''
+    Returns lookups values drawn from range(size), where the value of rank k has a weight of 1 / k ** exponent.
+    The ranks are shuffled, so the popular values are spread over the initial list.
+    '''
+    weights = [1 / rank ** exponent for rank in range(1, size + 1)]
+    values = list(range(size))
+    random.shuffle(values)
+    cumulative = list(itertools.accumulate(weights))
+    return random.choices(values, cum_weights=cumulative, k=lookups)
+
+
+def main():
+    random.seed(0)
+    workload = zipf_workload(SIZE, LOOKUPS, ZIPF_EXPONENT)
+
+    print(f'{SIZE} values, {LOOKUPS} lookups, Zipf exponent {ZIPF_EXPONENT}')
+    print(f"{'structure':<18}{'policy':<15}{'avg depth':>12}{'us/lookup':>12}")
+    for cls in (LinkedList, DoublyLinkedList):
+        for policy in (None,) + cls.POLICIES:
+            linked_list = cls(*range(SIZE), policy=policy)
+
+            depth = 0
+            start = time.perf_counter()
+            for value in workload:
+                depth += linked_list.find(value)
+            elapsed = time.perf_counter() - start
+
+            print(f'{cls.__name__:<18}{str(policy):<15}{depth / LOOKUPS:>12.1f}{elapsed / LOOKUPS * 1e6:>12.2f}')
+
+
+if __name__ == '__main__':
+    main()
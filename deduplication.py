@@ -0,0 +1,168 @@
+import math
+
+_MASK = (1 << 64) - 1
+
+
+def _mix(value):
+    '''
+    Scrambles a 64-bit integer (splitmix64 finaliser), so that consecutive hashes spread over the bit array.
+    '''
+    value = (value + 0x9E3779B97F4A7C15) & _MASK
+    value = ((value ^ (value >> 30)) * 0xBF58476D1CE4E5B9) & _MASK
+    value = ((value ^ (value >> 27)) * 0x94D049BB133111EB) & _MASK
+    return value ^ (value >> 31)
+
+
+class BloomFilter:
+    '''
+    Represents a Bloom filter, a compact set that may report false positives but never false negatives.
+
+    All bit positions of an item are derived from hash(item), the only hash that is guaranteed to agree with equality.
+    Distinct items with equal hashes, such as -1 and -2 or 0 and 2**61 - 1, are therefore always
+    reported as present once either was added, whatever the error rate.
+
+    Attributes:
+        size: The number of bits in the filter.
+        hash_count: The number of bit positions set for every item.
+        bits: The bit array of the filter.
+    '''
+    def __init__(self, capacity, error_rate=0.01, max_bytes=None):
+        '''
+        Initializes a new instance of the BloomFilter class.
+
+        Parameters:
+            capacity: The expected number of distinct items.
+            error_rate (float, optional): The targeted false positive rate. Defaults to 0.01.
+            max_bytes (int, optional): An upper bound for the size of the bit array. When the targeted
+                error rate would need more memory, the filter is capped and its error rate rises. Defaults to None.
+
+        Raises:
+            ValueError: If the capacity is negative, the error rate is not between 0 and 1,
+                or max_bytes is not positive.
+        '''
+        if capacity < 0:
+            raise ValueError("Capacity cannot be negative")
+
+        if not 0 < error_rate < 1:
+            raise ValueError("Error rate must be between 0 and 1")
+
+        if max_bytes is not None and max_bytes <= 0:
+            raise ValueError("Maximum number of bytes must be positive")
+
+        capacity = max(capacity, 1)
+        size = math.ceil(-capacity * math.log(error_rate) / (math.log(2) ** 2))
+        if max_bytes is not None:
+            size = min(size, max_bytes * 8)
+
+        self.size = max(size, 8)
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+
+    def __contains__(self, item):
+        '''
+        Check if the item may have been added to the filter.
+
+        Parameters:
+            item: The hashable item to look up.
+
+        Returns:
+            bool: False if the item was certainly never added, True if it probably was.
+        '''
+        bits = self.bits
+        size = self.size
+        position, step = self._hashes(item)
+        for _ in range(self.hash_count):
+            if not bits[position >> 3] & (1 << (position & 7)):
+                return False
+            position = (position + step) % size
+        return True
+
+    def __sizeof__(self):
+        '''
+        Returns the size of the filter in bytes, including its bit array.
+
+        Returns:
+            int: The size of the filter in bytes.
+        '''
+        return object.__sizeof__(self) + self.bits.__sizeof__()
+
+    def _hashes(self, item):
+        '''
+        Returns the first bit position and the step between positions of the given item,
+        both derived from a single hash (double hashing).
+        '''
+        mixed = _mix(hash(item) & _MASK)
+        return (mixed & 0xFFFFFFFF) % self.size, ((mixed >> 32) % self.size) | 1
+
+    def add(self, item):
+        '''
+        Adds the item to the filter.
+
+        Parameters:
+            item: The hashable item to add.
+
+        Returns:
+            bool: True if the item was probably added before, False if it certainly was not.
+        '''
+        bits = self.bits
+        size = self.size
+        present = True
+        position, step = self._hashes(item)
+        for _ in range(self.hash_count):
+            index = position >> 3
+            mask = 1 << (position & 7)
+            if not bits[index] & mask:
+                bits[index] |= mask
+                present = False
+            position = (position + step) % size
+        return present
+
+    def estimated_error_rate(self, count):
+        '''
+        Returns the expected false positive rate after the given number of distinct items has been added.
+
+        Parameters:
+            count: The number of distinct items added.
+
+        Returns:
+            float: The expected false positive rate.
+        '''
+        return (1 - math.exp(-self.hash_count * count / self.size)) ** self.hash_count
+
+
+def duplicate_checker(capacity, key=None, approximate=False, error_rate=0.01, max_bytes=None):
+    '''
+    Returns a function that reports whether a value was seen before, and records it.
+
+    In exact mode the keys are kept in a set. In approximate mode they are kept in a Bloom filter,
+    so a value may be wrongly reported as seen with about the given error rate, but memory stays bounded.
+    Keys with equal hash() values are always reported as seen in approximate mode (see BloomFilter).
+
+    Parameters:
+        capacity: The expected number of values, used to size the Bloom filter.
+        key (optional): A function computing the key a value is deduplicated by. Defaults to the value itself.
+        approximate (bool, optional): Whether to use a Bloom filter instead of a set. Defaults to False.
+        error_rate (float, optional): The targeted false positive rate in approximate mode. Defaults to 0.01.
+        max_bytes (int, optional): The memory cap of the Bloom filter in approximate mode. Defaults to None.
+
+    Returns:
+        function: A function taking a value and returning True if its key was (probably) seen before.
+    '''
+    if approximate:
+        seen = BloomFilter(capacity, error_rate, max_bytes)
+        add = seen.add
+
+        if key is None:
+            return add
+        return lambda value: add(key(value))
+
+    seen = set()
+
+    def is_duplicate(value):
+        value_key = value if key is None else key(value)
+        if value_key in seen:
+            return True
+        seen.add(value_key)
+        return False
+
+    return is_duplicate
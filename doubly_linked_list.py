@@ -1,3 +1,9 @@
+import sys
+
+from deduplication import duplicate_checker
+from memory_profiling import deep_getsizeof, node_overhead
+
+
 class Node:
     '''
     Represents a single node in a linked list.
@@ -36,12 +42,19 @@ class DoublyLinkedList:
     '''
     Represents a doubly linked list data structure.
 
+    The list keeps an orientation flag so it can be reversed in constant time.
+    While reversed, the roles of each node's next and prev references are swapped,
+    and every method walks the nodes in the logical (reversed) order.
+
     Attributes:
         head: The first node in the linked list.
         tail: The last node in the linked list.
         length: The number of nodes in the linked list.
+        policy: The self-organizing policy applied on lookups, one of POLICIES, or None for a static list.
     '''
-    def __init__(self, *args):
+    POLICIES = ('move_to_front', 'transpose', 'count')
+
+    def __init__(self, *args, policy=None):
         '''
         Initializes a new instance of the DoublyLinkedList class.
 
@@ -50,21 +63,150 @@ class DoublyLinkedList:
                 If provided, nodes will be created for each value and appended to the linked list in the order they are given.
                 If a node instance is provided, it will be appended directly.
                 If a raw value is provided, a node will be created for it and appended to the linked list.
+            policy (str, optional): The self-organizing policy applied when a value is looked up
+                by access, find or the in operator. Defaults to None, which never reorders the nodes.
+                - 'move_to_front': The found node is moved to the head.
+                - 'transpose': The found node is swapped with the node before it.
+                - 'count': The found node is moved before all nodes that were looked up fewer times.
 
         Raises:
             TypeError: If a value cannot be converted to a Node instance.
+            ValueError: If the policy is not one of POLICIES.
         '''
-        self.head = None
-        self.tail = None
+        if policy is not None and policy not in self.POLICIES:
+            raise ValueError(f"Unknown policy {policy}. Expected one of {self.POLICIES}")
+
+        self._head = None
+        self._tail = None
+        self._reversed = False
         self.length = 0
+        self.policy = policy
+        self._access_counts = {}
 
         for arg in args:
             if isinstance(arg, Node):
                 self.append_node(arg)
             else:
                 self.append(arg)
-            
-    
+
+    @property
+    def head(self):
+        '''
+        Returns the first node of the linked list, taking the orientation into account.
+
+        Returns:
+            node: The first node in the linked list.
+        '''
+        return self._tail if self._reversed else self._head
+
+    @head.setter
+    def head(self, node):
+        if self._reversed:
+            self._tail = node
+        else:
+            self._head = node
+
+    @property
+    def tail(self):
+        '''
+        Returns the last node of the linked list, taking the orientation into account.
+
+        Returns:
+            node: The last node in the linked list.
+        '''
+        return self._head if self._reversed else self._tail
+
+    @tail.setter
+    def tail(self, node):
+        if self._reversed:
+            self._head = node
+        else:
+            self._tail = node
+
+    def _next(self, node):
+        '''
+        Returns the node that follows the given node in the current orientation.
+        '''
+        return node.prev if self._reversed else node.next
+
+    def _prev(self, node):
+        '''
+        Returns the node that precedes the given node in the current orientation.
+        '''
+        return node.next if self._reversed else node.prev
+
+    def _link(self, left, right):
+        '''
+        Links two nodes so that right follows left in the current orientation.
+        '''
+        if self._reversed:
+            left.prev = right
+            right.next = left
+        else:
+            left.next = right
+            right.prev = left
+
+    def _unlink(self, left, right):
+        '''
+        Breaks the link between two adjacent nodes, where right follows left in the current orientation.
+        '''
+        if self._reversed:
+            left.prev = None
+            right.next = None
+        else:
+            left.next = None
+            right.prev = None
+
+    def _detach(self, node):
+        '''
+        Takes the given node out of the chain, without changing the length of the linked list.
+        '''
+        before = self._prev(node)
+        after = self._next(node)
+
+        if before:
+            self._unlink(before, node)
+        if after:
+            self._unlink(node, after)
+
+        if before and after:
+            self._link(before, after)
+        elif before:
+            self.tail = before
+        elif after:
+            self.head = after
+        else:
+            self.head = None
+            self.tail = None
+
+    def _insert_before(self, node, reference):
+        '''
+        Links a detached node into the chain right before the reference node, without changing the length of the linked list.
+        '''
+        before = self._prev(reference)
+
+        if before:
+            self._link(before, node)
+        else:
+            self.head = node
+
+        self._link(node, reference)
+
+    def _node_at(self, index):
+        '''
+        Returns the node at the given non-negative physical index, ignoring the orientation.
+        Starts from whichever physical end is nearer.
+        '''
+        if index <= (self.length // 2):
+            current = self._head
+            for _ in range(index):
+                current = current.next
+        else:
+            current = self._tail
+            for _ in range(self.length - index - 1):
+                current = current.prev
+        return current
+
     def __str__(self):
         '''
         Returns a string representation of the linked list.
@@ -72,17 +214,18 @@ class DoublyLinkedList:
         Returns:
             str: String representation of the linked list.
         '''
+        forward = 'prev' if self._reversed else 'next'
         current_node = self.head
         result_string = ''
 
         while current_node:
             result_string += str(current_node)
-            if current_node.next:
+            current_node = getattr(current_node, forward)
+            if current_node:
                 result_string += ' <=> '
-            current_node = current_node.next
-        
+
         return result_string
-    
+
     def __contains__(self, value):
         '''
         Check if the linked list contains the given value.
@@ -93,13 +236,32 @@ class DoublyLinkedList:
         Returns:
             bool: True if the value is found in the linked list, False otherwise.
         '''
+        return self._search(value)[1] is not None
+
+    def __iter__(self):
+        '''
+        Yields the values of the linked list, from head to tail.
+        Every call returns an independent iterator, so the linked list can be iterated in nested loops.
+
+        Yields:
+            value: The next value in the linked list.
+        '''
+        forward = 'prev' if self._reversed else 'next'
         current = self.head
+
         while current:
-            if current.value == value:
-                return True
-            current = current.next
-        return False
-    
+            yield current.value
+            current = getattr(current, forward)
+
+    def __len__(self):
+        '''
+        Returns the length of the linked list.
+
+        Returns:
+            int: Length of the linked list.
+        '''
+        return self.length
+
     def append_node(self, node):
         '''
         Appends a node to the end of the linked list.
@@ -112,16 +274,15 @@ class DoublyLinkedList:
         '''
         if not isinstance(node, Node):
             raise TypeError("Invalid node type. Expected Node instance.")
-        
+
         if self.head:
-            self.tail.next = node
-            node.prev = self.tail
+            self._link(self.tail, node)
         else:
             self.head = node
-        
+
         self.tail = node
         self.length += 1
-    
+
     def append(self, value):
         '''
         Appends a new node with the given value to the end of the linked list.
@@ -132,11 +293,10 @@ class DoublyLinkedList:
         node_to_append = Node(value)
 
         if self.head:
-            self.tail.next = node_to_append
-            node_to_append.prev = self.tail
+            self._link(self.tail, node_to_append)
         else:
             self.head = node_to_append
-        
+
         self.tail = node_to_append
         self.length += 1
 
@@ -150,11 +310,10 @@ class DoublyLinkedList:
         node_to_prepend = Node(value)
 
         if self.head:
-            self.head.prev = node_to_prepend
-            node_to_prepend.next = node_to_prepend
+            self._link(node_to_prepend, self.head)
         else:
             self.tail = node_to_prepend
-        
+
         self.head = node_to_prepend
         self.length += 1
 
@@ -171,49 +330,20 @@ class DoublyLinkedList:
         '''
         if index < -(self.length+1) or index > self.length:
             raise ValueError("Index out of range")
-        
-        node_to_insert = Node(value)
 
-        if not self.head:
-            self.head = node_to_insert
-            self.tail = node_to_insert
-        elif index == 0 or index == -(self.length+1):
-            node_to_insert.next = self.head
-            self.head.prev = node_to_insert
-            self.head = node_to_insert
+        if index < 0:
+            index += self.length + 1
+
+        if index == 0:
+            self.prepend(value)
         elif index == self.length:
-            self.tail.next = node_to_insert
-            node_to_insert.prev = self.tail
-            self.tail = node_to_insert
-        elif index < 0:
-            if abs(index) <= (self.length//2):
-                current = self.head
-                for _ in range(self.length+index):
-                    current = current.next
-            else:
-                current = self.tail
-                for _ in range(abs(index) - 1):
-                    current = current.prev
-            node_to_insert.next = current.next
-            node_to_insert.prev = current
-            current.next.prev = node_to_insert
-            current.next = node_to_insert
+            self.append(value)
         else:
-            if index <= (self.length // 2):
-                print("Start from head")
-                current = self.head
-                for _ in range(index - 1):
-                    current = current.next
-            else:
-                print("Start from tail")
-                current = self.tail
-                for _ in range(self.length - index):
-                    current = current.prev
-            node_to_insert.next = current.next
-            node_to_insert.prev = current
-            current.next.prev = node_to_insert
-            current.next = node_to_insert
-        self.length += 1
+            node_to_insert = Node(value)
+            current = self.get(index - 1)
+            self._link(node_to_insert, self._next(current))
+            self._link(current, node_to_insert)
+            self.length += 1
 
     def find(self, value):
         '''
@@ -223,18 +353,87 @@ class DoublyLinkedList:
             value: The value to search for in the linked list.
 
         Returns:
-            index: The index of the first occurrence of the value. If the value is not found, returns -1.
+            index: The index of the first occurrence of the value, before any reordering by the policy.
+                If the value is not found, returns -1.
+        '''
+        return self._search(value)[0]
+
+    def access(self, value):
+        '''
+        Returns the first node with the given value, reordering the linked list according to its policy.
+
+        Parameters:
+            value: The value to search for in the linked list.
+
+        Returns:
+            node: The first node with the given value.
+
+        Raises:
+            ValueError: If the value is not found in the linked list.
+        '''
+        node = self._search(value)[1]
+        if node is None:
+            raise ValueError(f"Value {value} not found in the linked list")
+        return node
+
+    def _scan(self, value):
+        '''
+        Returns the index and the node of the first occurrence of the value, or (-1, None) if it is not found.
+        The orientation is read once, so the walk itself only follows plain attributes.
         '''
         current = self.head
         index = 0
 
-        while current:
-            if current.value == value:
-                return index
-            index += 1
-            current = current.next
+        if self._reversed:
+            while current:
+                if current.value == value:
+                    return index, current
+                index += 1
+                current = current.prev
+        else:
+            while current:
+                if current.value == value:
+                    return index, current
+                index += 1
+                current = current.next
 
-        return -1
+        return -1, None
+
+    def _search(self, value):
+        '''
+        Returns the index and the node of the first occurrence of the value, or (-1, None) if it is not found.
+        The found node is moved according to the policy of the linked list.
+        '''
+        index, current = self._scan(value)
+        if current is None:
+            return -1, None
+
+        if self.policy == 'count':
+            count = self._access_counts.get(current, 0) + 1
+            self._access_counts[current] = count
+
+        if self.policy is None or current is self.head:
+            return index, current
+
+        if self.policy == 'move_to_front':
+            reference = self.head
+        elif self.policy == 'transpose':
+            reference = self._prev(current)
+        else:
+            counts = self._access_counts
+            backward = 'next' if self._reversed else 'prev'
+            reference = current
+            before = getattr(current, backward)
+            while before and counts.get(before, 0) < count:
+                reference = before
+                before = getattr(before, backward)
+            if reference is current:
+                return index, current
+
+        self._detach(current)
+        self._insert_before(current, reference)
+
+        return index, current
 
     def get(self, index):
         '''
@@ -251,29 +450,14 @@ class DoublyLinkedList:
         '''
         if index >= self.length or index < -(self.length):
             raise IndexError("Index out of range")
-        
+
         if index < 0:
-            if abs(index) <= (self.length//2):
-                current = self.head
-                for _ in range(self.length+index):
-                    current = current.next
-                return current
-            else:
-                current = self.tail
-                for _ in range(abs(index) - 1):
-                    current = current.prev
-                return current
-        else:
-            if abs(index) <= (self.length//2):
-                current = self.head
-                for _ in range(index):
-                    current = current.next
-                return current
-            else:
-                current = self.tail
-                for _ in range(self.length-index-1):
-                    current = current.prev
-                return current
+            index += self.length
+
+        if self._reversed:
+            index = self.length - index - 1
+
+        return self._node_at(index)
 
     def set_value(self, index, value):
         '''
@@ -306,10 +490,294 @@ class DoublyLinkedList:
             self.head = None
             self.tail = None
         else:
-            self.head.next.prev = None
-            self.head = self.head.next
-            node_to_pop.next = None
-        
+            self.head = self._next(node_to_pop)
+            self._unlink(node_to_pop, self.head)
+
         self.length -= 1
+        self._access_counts.pop(node_to_pop, None)
         return node_to_pop
-    
\ No newline at end of file
+
+    def pop(self, index=None):
+        '''
+        Removes and returns the node at the specified index, or the last node if index is not provided.
+
+        Parameters:
+            index (int, optional): The index of the node to remove. If not provided, the last node is removed. Defaults to None.
+
+        Returns:
+            node: The removed node.
+
+        Raises:
+            IndexError: If the linked list is empty.
+            IndexError: If the provided index is out of range.
+        '''
+        if not self.head:
+            raise IndexError("Cannot pop from an empty linked list")
+
+        node_to_pop = self.tail if index is None else self.get(index)
+        self._detach(node_to_pop)
+
+        self.length -= 1
+        self._access_counts.pop(node_to_pop, None)
+        return node_to_pop
+
+    def remove(self, value):
+        '''
+        Removes the first occurrence of a node with the given value from the linked list.
+
+        Parameters:
+            value: The value of the node to remove from the linked list.
+
+        Returns:
+            node: The removed node.
+
+        Raises:
+            ValueError: If the value is not found in the linked list.
+        '''
+        node_to_remove = self._scan(value)[1]
+        if node_to_remove is None:
+            raise ValueError(f"Value {value} not found in the linked list")
+
+        self._detach(node_to_remove)
+        self.length -= 1
+        self._access_counts.pop(node_to_remove, None)
+        return node_to_remove
+
+    def remove_if(self, predicate):
+        '''
+        Removes every node whose value satisfies the given predicate, in a single traversal.
+
+        Parameters:
+            predicate: A function taking a value and returning True if its node should be removed.
+
+        Returns:
+            DoublyLinkedList: The removed nodes, relinked in their original order. No new nodes are allocated.
+        '''
+        forward = 'prev' if self._reversed else 'next'
+        removed = DoublyLinkedList()
+        prev = None
+        current = self.head
+
+        while current:
+            following = getattr(current, forward)
+            if predicate(current.value):
+                if following:
+                    self._unlink(current, following)
+                if prev:
+                    self._unlink(prev, current)
+                    if following:
+                        self._link(prev, following)
+                else:
+                    self.head = following
+                removed.append_node(current)
+                self.length -= 1
+                self._access_counts.pop(current, None)
+            else:
+                prev = current
+            current = following
+
+        self.tail = prev
+        return removed
+
+    def remove_all(self, value):
+        '''
+        Removes every node with the given value, in a single traversal.
+
+        Parameters:
+            value: The value of the nodes to remove from the linked list.
+
+        Returns:
+            int: The number of removed nodes.
+        '''
+        return len(self.remove_if(lambda node_value: node_value == value))
+
+    def discard_many(self, values):
+        '''
+        Removes every node whose value is one of the given values, in a single traversal.
+        Values that are not in the linked list are ignored.
+
+        Parameters:
+            values: An iterable of the values to remove from the linked list.
+
+        Returns:
+            int: The number of removed nodes.
+        '''
+        values = list(values)
+        try:
+            values = set(values)
+        except TypeError:
+            pass
+
+        return len(self.remove_if(lambda node_value: node_value in values))
+
+    def remove_duplicates(self, key=None, approximate=False, error_rate=0.01, max_bytes=None):
+        '''
+        Removes nodes with duplicate values from the linked list, keeping only the first occurrence of each value.
+
+        Parameters:
+            key (optional): A function computing the key values are compared by. Defaults to the value itself.
+            approximate (bool, optional): Whether to track seen keys in a Bloom filter instead of a set.
+                Memory stays bounded, but a unique value is wrongly removed with about the given error rate.
+                Keys with equal hash() values always collide, whatever the error rate (e.g. -1 and -2).
+                Defaults to False.
+            error_rate (float, optional): The targeted false positive rate in approximate mode. Defaults to 0.01.
+            max_bytes (int, optional): The memory cap of the Bloom filter in approximate mode. Defaults to None.
+
+        Returns:
+            int: The number of removed nodes.
+
+        Raises:
+            RuntimeError: If linked list is empty.
+        '''
+        if not self.head:
+            raise RuntimeError("Cannot remove duplicates from an empty linked list")
+
+        is_duplicate = duplicate_checker(self.length, key, approximate, error_rate, max_bytes)
+
+        return len(self.remove_if(is_duplicate))
+
+    def unique(self, key=None, approximate=False, error_rate=0.01, max_bytes=None):
+        '''
+        Yields the values of the linked list, skipping values whose key was already yielded.
+        The linked list itself is not modified.
+
+        Parameters:
+            key (optional): A function computing the key values are compared by. Defaults to the value itself.
+            approximate (bool, optional): Whether to track seen keys in a Bloom filter instead of a set.
+                Memory stays bounded, but a unique value is wrongly skipped with about the given error rate.
+                Keys with equal hash() values always collide, whatever the error rate (e.g. -1 and -2).
+                Defaults to False.
+            error_rate (float, optional): The targeted false positive rate in approximate mode. Defaults to 0.01.
+            max_bytes (int, optional): The memory cap of the Bloom filter in approximate mode. Defaults to None.
+
+        Yields:
+            value: The first value of every distinct key, in order.
+        '''
+        is_duplicate = duplicate_checker(self.length, key, approximate, error_rate, max_bytes)
+        forward = 'prev' if self._reversed else 'next'
+        current = self.head
+
+        while current:
+            if not is_duplicate(current.value):
+                yield current.value
+            current = getattr(current, forward)
+
+    def reverse(self):
+        '''
+        Reverses the order of the nodes in the linked list in constant time.
+
+        No node is relinked; the orientation of the list is flipped instead,
+        so that head and tail, as well as the roles of next and prev, are swapped.
+        '''
+        self._reversed = not self._reversed
+
+    def reversed_copy(self):
+        '''
+        Returns a new linked list holding the values of this linked list in reverse order.
+
+        Returns:
+            DoublyLinkedList: A new linked list with new nodes in reverse order.
+        '''
+        backward = 'next' if self._reversed else 'prev'
+        reversed_list = DoublyLinkedList()
+        current = self.tail
+
+        while current:
+            reversed_list.append(current.value)
+            current = getattr(current, backward)
+
+        return reversed_list
+
+    def reverse_range(self, start, stop):
+        '''
+        Reverses, in place and in a single walk, the nodes from index start up to but not including index stop.
+
+        Parameters:
+            start: The index of the first node to reverse.
+            stop: The index after the last node to reverse.
+
+        Raises:
+            IndexError: If start or stop is out of range.
+            ValueError: If start is greater than stop.
+        '''
+        if start < 0:
+            start += self.length
+        if stop < 0:
+            stop += self.length
+
+        if start < 0 or stop < 0 or start > self.length or stop > self.length:
+            raise IndexError("Index out of range")
+
+        if start > stop:
+            raise ValueError("Start index cannot be greater than stop index")
+
+        if stop - start < 2:
+            return
+
+        # Reversing a segment is symmetric, so it is done on the physical layout.
+        if self._reversed:
+            start, stop = self.length - stop, self.length - start
+
+        first = self._node_at(start)
+        before = first.prev
+        current = first
+
+        for _ in range(stop - start):
+            current.next, current.prev = current.prev, current.next
+            last = current
+            current = current.prev
+
+        first.next = current
+        last.prev = before
+
+        if before:
+            before.next = last
+        else:
+            self._head = last
+
+        if current:
+            current.prev = first
+        else:
+            self._tail = first
+
+    def memory_usage(self, deep=False):
+        '''
+        Returns a report of the memory used by the linked list.
+
+        The per-node overhead is measured on probe nodes, so the report does not
+        allocate anything on the nodes of the linked list itself.
+
+        Parameters:
+            deep (bool, optional): Whether to include the deep size of the stored values. Values shared
+                between nodes are counted once. Defaults to False.
+
+        Returns:
+            dict: The report, holding:
+                length: The number of nodes.
+                list: The size of the linked list object, its attributes and its access counts, in bytes.
+                node: The overhead of a single node, broken down into object, attributes and total, in bytes.
+                nodes: The overhead of all nodes, in bytes.
+                values: The deep size of the stored values in bytes, or None if deep is False.
+                total: The sum of list, nodes and values, in bytes.
+        '''
+        list_size = sys.getsizeof(self) + sys.getsizeof(vars(self)) + sys.getsizeof(self._access_counts)
+        node = node_overhead(Node)
+        nodes_size = node['total'] * self.length
+
+        values_size = None
+        if deep:
+            seen = set()
+            values_size = 0
+            current = self._head
+            while current:
+                values_size += deep_getsizeof(current.value, seen)
+                current = current.next
+
+        return {
+            'length': self.length,
+            'list': list_size,
+            'node': node,
+            'nodes': nodes_size,
+            'values': values_size,
+            'total': list_size + nodes_size + (values_size or 0),
+        }
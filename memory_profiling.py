@@ -0,0 +1,181 @@
+import inspect
+import sys
+import tracemalloc
+
+
+def deep_getsizeof(obj, seen=None):
+    '''
+    Returns the size in bytes of an object, including the objects it references.
+
+    Containers (dicts, lists, tuples, sets and frozensets) and instance attributes are followed.
+    Every object is counted only once, so shared objects do not inflate the result.
+
+    Parameters:
+        obj: The object to measure.
+        seen (set, optional): Ids of objects that are already counted. Defaults to None.
+
+    Returns:
+        int: The size of the object and everything it references, in bytes.
+    '''
+    if seen is None:
+        seen = set()
+
+    if id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+
+    size = sys.getsizeof(obj)
+
+    if isinstance(obj, dict):
+        for key, value in obj.items():
+            size += deep_getsizeof(key, seen)
+            size += deep_getsizeof(value, seen)
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        for item in obj:
+            size += deep_getsizeof(item, seen)
+    elif hasattr(obj, '__dict__') and not isinstance(obj, type):
+        size += deep_getsizeof(vars(obj), seen)
+
+    return size
+
+
+_node_overhead_cache = {}
+
+
+def node_overhead(node_class, samples=1000):
+    '''
+    Returns the memory overhead of a single node, broken down by component.
+
+    The footprint is traced with tracemalloc over a batch of probe nodes, since reading the attribute
+    dictionary of a node may allocate it. The result is cached per node class.
+
+    Parameters:
+        node_class: The node class to measure. It must accept a single value argument.
+        samples (int, optional): The number of probe nodes to allocate. Defaults to 1000.
+
+    Returns:
+        dict: The size of the node object, of its attribute storage and their total, in bytes.
+    '''
+    if node_class in _node_overhead_cache:
+        return dict(_node_overhead_cache[node_class])
+
+    started_tracing = not tracemalloc.is_tracing()
+    if started_tracing:
+        tracemalloc.start()
+    try:
+        probes = [None] * samples
+        before, _ = tracemalloc.get_traced_memory()
+        for i in range(samples):
+            probes[i] = node_class(0)
+        after, _ = tracemalloc.get_traced_memory()
+    finally:
+        if started_tracing:
+            tracemalloc.stop()
+
+    total = round((after - before) / samples)
+    object_size = sys.getsizeof(probes[0])
+
+    _node_overhead_cache[node_class] = {
+        'object': object_size,
+        'attributes': max(total - object_size, 0),
+        'total': max(total, object_size),
+    }
+    return dict(_node_overhead_cache[node_class])
+
+
+class AllocationProfiler:
+    '''
+    Attributes memory allocations to the public methods of a linked list, using tracemalloc.
+
+    While the profiler is active, the public methods of the given linked list are wrapped
+    so that each call records the bytes it allocated and kept (net) and the peak it reached.
+    The figures are inclusive: a method that calls another method also counts its allocations.
+    Peaks are only recorded for calls made from outside the linked list, since tracemalloc keeps a single peak.
+    Generator methods are not wrapped, since a call only creates the generator and allocates nothing of its own.
+
+    Example:
+        with AllocationProfiler(linked_list) as profiler:
+            linked_list.append(1)
+        profiler.report()
+
+    Attributes:
+        linked_list: The linked list being profiled.
+        stats: Per method name, the number of calls, the net allocated bytes and the largest peak in bytes.
+    '''
+    def __init__(self, linked_list):
+        '''
+        Initializes a new instance of the AllocationProfiler class.
+
+        Parameters:
+            linked_list: The linked list whose methods will be profiled.
+        '''
+        self.linked_list = linked_list
+        self.stats = {}
+        self._started_tracing = False
+        self._wrapped = []
+        self._depth = 0
+
+    def __enter__(self):
+        '''
+        Starts tracemalloc if needed and wraps the public methods of the linked list.
+
+        Returns:
+            self: The active profiler.
+        '''
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+
+        for name in dir(type(self.linked_list)):
+            if name.startswith('_') or inspect.isgeneratorfunction(getattr(type(self.linked_list), name)):
+                continue
+            method = getattr(self.linked_list, name)
+            if callable(method):
+                setattr(self.linked_list, name, self._wrap(name, method))
+                self._wrapped.append(name)
+
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        '''
+        Restores the original methods of the linked list and stops tracemalloc if it was started by the profiler.
+        '''
+        for name in self._wrapped:
+            delattr(self.linked_list, name)
+        self._wrapped = []
+
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+
+    def _wrap(self, name, method):
+        '''
+        Returns a wrapper around the given bound method which records its allocations.
+        '''
+        def wrapper(*args, **kwargs):
+            outermost = self._depth == 0
+            if outermost:
+                tracemalloc.reset_peak()
+            before, _ = tracemalloc.get_traced_memory()
+            self._depth += 1
+            try:
+                return method(*args, **kwargs)
+            finally:
+                self._depth -= 1
+                after, peak = tracemalloc.get_traced_memory()
+                entry = self.stats.setdefault(name, {'calls': 0, 'allocated': 0, 'peak': 0})
+                entry['calls'] += 1
+                entry['allocated'] += after - before
+                if outermost:
+                    entry['peak'] = max(entry['peak'], peak - before)
+
+        return wrapper
+
+    def report(self):
+        '''
+        Returns the collected statistics, ordered by the net allocated bytes, largest first.
+
+        Returns:
+            list: Tuples of the method name and its statistics.
+        '''
+        return sorted(self.stats.items(), key=lambda item: item[1]['allocated'], reverse=True)
@@ -1,3 +1,9 @@
+import sys
+
+from deduplication import duplicate_checker
+from memory_profiling import deep_getsizeof, node_overhead
+
+
 class Node:
     '''
     Represents a single node in a linked list.
@@ -38,8 +44,11 @@ class LinkedList:
         head: The first node in the linked list.
         tail: The last node in the linked list.
         length: The number of nodes in the linked list.
+        policy: The self-organizing policy applied on lookups, one of POLICIES, or None for a static list.
     '''
-    def __init__(self, *args):
+    POLICIES = ('move_to_front', 'transpose', 'count')
+
+    def __init__(self, *args, policy=None):
         '''
         Initializes a new instance of the LinkedList class.
 
@@ -48,13 +57,24 @@ class LinkedList:
                 If provided, nodes will be created for each value and appended to the linked list in the order they are given.
                 If a node instance is provided, it will be appended directly.
                 If a raw value is provided, a node will be created for it and appended to the linked list.
+            policy (str, optional): The self-organizing policy applied when a value is looked up
+                by access, find or the in operator. Defaults to None, which never reorders the nodes.
+                - 'move_to_front': The found node is moved to the head.
+                - 'transpose': The found node is swapped with the node before it.
+                - 'count': The found node is moved before all nodes that were looked up fewer times.
 
         Raises:
             TypeError: If a value cannot be converted to a Node instance.
+            ValueError: If the policy is not one of POLICIES.
         '''
+        if policy is not None and policy not in self.POLICIES:
+            raise ValueError(f"Unknown policy {policy}. Expected one of {self.POLICIES}")
+
         self.head = None
         self.tail = None
         self.length = 0
+        self.policy = policy
+        self._access_counts = {}
 
         for arg in args:
             if isinstance(arg, Node):
@@ -90,12 +110,7 @@ class LinkedList:
         Returns:
             bool: True if the value is found in the linked list, False otherwise.
         '''
-        current = self.head
-        while current:
-            if current.value == value:
-                return True
-            current = current.next
-        return False
+        return self._search(value)[1] is not None
     
     def __getitem__(self, index):
         '''
@@ -267,18 +282,118 @@ class LinkedList:
             value: The value to search for in the linked list.
 
         Returns:
-            index: The index of the first occurrence of the value. If the value is not found, returns -1.
+            index: The index of the first occurrence of the value, before any reordering by the policy.
+                If the value is not found, returns -1.
+        '''
+        return self._search(value)[0]
+
+    def access(self, value):
+        '''
+        Returns the first node with the given value, reordering the linked list according to its policy.
+
+        Parameters:
+            value: The value to search for in the linked list.
+
+        Returns:
+            node: The first node with the given value.
+
+        Raises:
+            ValueError: If the value is not found in the linked list.
         '''
+        node = self._search(value)[1]
+        if node is None:
+            raise ValueError(f"Value {value} not found in the linked list")
+        return node
+
+    def _search(self, value):
+        '''
+        Returns the index and the node of the first occurrence of the value, or (-1, None) if it is not found.
+        The found node is moved according to the policy of the linked list.
+        '''
+        if self.policy == 'count':
+            return self._search_counted(value)
+
+        before_prev = None
+        prev = None
         current = self.head
         index = 0
 
         while current:
             if current.value == value:
-                return index
+                break
+            before_prev, prev, current = prev, current, current.next
             index += 1
-            current = current.next
-        
-        return -1
+        else:
+            return -1, None
+
+        if self.policy is None or prev is None:
+            return index, current
+
+        new_prev = None if self.policy == 'move_to_front' else before_prev
+        self._move_after(current, prev, new_prev)
+
+        return index, current
+
+    def _search_counted(self, value):
+        '''
+        Searches like _search for the 'count' policy, in a single walk.
+        While walking, a stack keeps the last node seen for each access count that no later node reaches,
+        so the found node can be moved before the run of nodes just ahead of it that were looked up fewer times,
+        without a second walk.
+        '''
+        counts = self._access_counts
+        stack_counts = []
+        stack_nodes = []
+        top = -1
+        prev = None
+        current = self.head
+        index = 0
+
+        while current:
+            if current.value == value:
+                break
+            count = counts.get(current, 0)
+            if count == top:
+                stack_nodes[-1] = current
+            else:
+                while stack_counts and stack_counts[-1] <= count:
+                    stack_counts.pop()
+                    stack_nodes.pop()
+                stack_counts.append(count)
+                stack_nodes.append(current)
+                top = count
+            prev, current = current, current.next
+            index += 1
+        else:
+            return -1, None
+
+        count = counts.get(current, 0) + 1
+        counts[current] = count
+
+        while stack_counts and stack_counts[-1] < count:
+            stack_counts.pop()
+            stack_nodes.pop()
+        new_prev = stack_nodes[-1] if stack_nodes else None
+
+        if new_prev is not prev:
+            self._move_after(current, prev, new_prev)
+
+        return index, current
+
+    def _move_after(self, node, prev, new_prev):
+        '''
+        Moves the node, currently preceded by prev, right after new_prev, or to the head if new_prev is None.
+        '''
+        prev.next = node.next
+        if node is self.tail:
+            self.tail = prev
+
+        if new_prev:
+            node.next = new_prev.next
+            new_prev.next = node
+        else:
+            node.next = self.head
+            self.head = node
 
     def get(self, index):
         '''
@@ -342,6 +457,7 @@ class LinkedList:
             node_to_pop.next = None
         
         self.length -= 1
+        self._access_counts.pop(node_to_pop, None)
         return node_to_pop
     
     def pop(self, index=None):
@@ -381,6 +497,7 @@ class LinkedList:
                 self.tail = current
             
         self.length -= 1
+        self._access_counts.pop(node_to_pop, None)
         return node_to_pop
     
     def remove(self, value):
@@ -396,15 +513,88 @@ class LinkedList:
         Raises:
             ValueError: If the value is not found in the linked list.
         '''
-        if not value in self:
-            raise ValueError(f"Value {value} not found in the linked list")
-        
-        index_to_remove = self.find(value)
-        node_to_remove = self.get(index_to_remove)
-        self.pop(index_to_remove)
+        prev = None
+        current = self.head
 
-        self.length -= 1
-        return node_to_remove
+        while current:
+            if current.value == value:
+                if prev:
+                    prev.next = current.next
+                else:
+                    self.head = current.next
+                if current is self.tail:
+                    self.tail = prev
+                current.next = None
+                self.length -= 1
+                self._access_counts.pop(current, None)
+                return current
+            prev = current
+            current = current.next
+
+        raise ValueError(f"Value {value} not found in the linked list")
+
+    def remove_if(self, predicate):
+        '''
+        Removes every node whose value satisfies the given predicate, in a single traversal.
+
+        Parameters:
+            predicate: A function taking a value and returning True if its node should be removed.
+
+        Returns:
+            LinkedList: The removed nodes, relinked in their original order. No new nodes are allocated.
+        '''
+        removed = LinkedList()
+        prev = None
+        current = self.head
+
+        while current:
+            following = current.next
+            if predicate(current.value):
+                if prev:
+                    prev.next = following
+                else:
+                    self.head = following
+                current.next = None
+                removed.append_node(current)
+                self.length -= 1
+                self._access_counts.pop(current, None)
+            else:
+                prev = current
+            current = following
+
+        self.tail = prev
+        return removed
+
+    def remove_all(self, value):
+        '''
+        Removes every node with the given value, in a single traversal.
+
+        Parameters:
+            value: The value of the nodes to remove from the linked list.
+
+        Returns:
+            int: The number of removed nodes.
+        '''
+        return len(self.remove_if(lambda node_value: node_value == value))
+
+    def discard_many(self, values):
+        '''
+        Removes every node whose value is one of the given values, in a single traversal.
+        Values that are not in the linked list are ignored.
+
+        Parameters:
+            values: An iterable of the values to remove from the linked list.
+
+        Returns:
+            int: The number of removed nodes.
+        '''
+        values = list(values)
+        try:
+            values = set(values)
+        except TypeError:
+            pass
+
+        return len(self.remove_if(lambda node_value: node_value in values))
     
     def reverse(self):
         '''
@@ -413,36 +603,120 @@ class LinkedList:
         current = self.head
         prev = None
         while current:
-            temp = current.next
-            current.next = prev
-            prev = current
-            current = temp
+            current.next, prev, current = prev, current, current.next
         
         self.head, self.tail = self.tail, self.head
 
-    def remove_duplicates(self):
+    def reversed_copy(self):
+        '''
+        Returns a new linked list holding the values of this linked list in reverse order.
+
+        Returns:
+            LinkedList: A new linked list with new nodes in reverse order.
+        '''
+        reversed_list = LinkedList()
+        current = self.head
+
+        while current:
+            reversed_list.prepend(current.value)
+            current = current.next
+
+        return reversed_list
+
+    def reverse_range(self, start, stop):
+        '''
+        Reverses, in place and in a single walk, the nodes from index start up to but not including index stop.
+
+        Parameters:
+            start: The index of the first node to reverse.
+            stop: The index after the last node to reverse.
+
+        Raises:
+            IndexError: If start or stop is out of range.
+            ValueError: If start is greater than stop.
+        '''
+        if start < 0:
+            start += self.length
+        if stop < 0:
+            stop += self.length
+
+        if start < 0 or stop < 0 or start > self.length or stop > self.length:
+            raise IndexError("Index out of range")
+
+        if start > stop:
+            raise ValueError("Start index cannot be greater than stop index")
+
+        if stop - start < 2:
+            return
+
+        before = self.get(start - 1) if start > 0 else None
+        first = before.next if before else self.head
+        current = first
+        prev = None
+
+        for _ in range(stop - start):
+            current.next, prev, current = prev, current, current.next
+
+        first.next = current
+
+        if before:
+            before.next = prev
+        else:
+            self.head = prev
+
+        if not current:
+            self.tail = first
+
+    def remove_duplicates(self, key=None, approximate=False, error_rate=0.01, max_bytes=None):
         '''
         Removes nodes with duplicate values from the linked list, keeping only the first occurrence of each value.
 
+        Parameters:
+            key (optional): A function computing the key values are compared by. Defaults to the value itself.
+            approximate (bool, optional): Whether to track seen keys in a Bloom filter instead of a set.
+                Memory stays bounded, but a unique value is wrongly removed with about the given error rate.
+                Keys with equal hash() values always collide, whatever the error rate (e.g. -1 and -2).
+                Defaults to False.
+            error_rate (float, optional): The targeted false positive rate in approximate mode. Defaults to 0.01.
+            max_bytes (int, optional): The memory cap of the Bloom filter in approximate mode. Defaults to None.
+
+        Returns:
+            int: The number of removed nodes.
+
         Raises:
             RuntimeError: If linked list is empty.
         '''
         if not self.head:
             raise RuntimeError("Cannot remove duplicates from an empty linked list")
-        
-        seen = set()
+
+        is_duplicate = duplicate_checker(self.length, key, approximate, error_rate, max_bytes)
+
+        return len(self.remove_if(is_duplicate))
+
+    def unique(self, key=None, approximate=False, error_rate=0.01, max_bytes=None):
+        '''
+        Yields the values of the linked list, skipping values whose key was already yielded.
+        The linked list itself is not modified.
+
+        Parameters:
+            key (optional): A function computing the key values are compared by. Defaults to the value itself.
+            approximate (bool, optional): Whether to track seen keys in a Bloom filter instead of a set.
+                Memory stays bounded, but a unique value is wrongly skipped with about the given error rate.
+                Keys with equal hash() values always collide, whatever the error rate (e.g. -1 and -2).
+                Defaults to False.
+            error_rate (float, optional): The targeted false positive rate in approximate mode. Defaults to 0.01.
+            max_bytes (int, optional): The memory cap of the Bloom filter in approximate mode. Defaults to None.
+
+        Yields:
+            value: The first value of every distinct key, in order.
+        '''
+        is_duplicate = duplicate_checker(self.length, key, approximate, error_rate, max_bytes)
         current = self.head
-        seen.add(current.value)
-        
-        while current.next:
-            if current.next.value in seen:
-                current.next = current.next.next
-                self.length -= 1
-            else:
-                seen.add(current.next.value)
-                current = current.next
-        
-        self.tail = current
+
+        while current:
+            if not is_duplicate(current.value):
+                yield current.value
+            current = current.next
 
     def merge(self, linked_list):
         '''
@@ -465,3 +739,45 @@ class LinkedList:
         
         current.next = linked_list.head
         self.tail = linked_list.tail
+
+    def memory_usage(self, deep=False):
+        '''
+        Returns a report of the memory used by the linked list.
+
+        The per-node overhead is measured on probe nodes, so the report does not
+        allocate anything on the nodes of the linked list itself.
+
+        Parameters:
+            deep (bool, optional): Whether to include the deep size of the stored values. Values shared
+                between nodes are counted once. Defaults to False.
+
+        Returns:
+            dict: The report, holding:
+                length: The number of nodes.
+                list: The size of the linked list object, its attributes and its access counts, in bytes.
+                node: The overhead of a single node, broken down into object, attributes and total, in bytes.
+                nodes: The overhead of all nodes, in bytes.
+                values: The deep size of the stored values in bytes, or None if deep is False.
+                total: The sum of list, nodes and values, in bytes.
+        '''
+        list_size = sys.getsizeof(self) + sys.getsizeof(vars(self)) + sys.getsizeof(self._access_counts)
+        node = node_overhead(Node)
+        nodes_size = node['total'] * self.length
+
+        values_size = None
+        if deep:
+            seen = set()
+            values_size = 0
+            current = self.head
+            while current:
+                values_size += deep_getsizeof(current.value, seen)
+                current = current.next
+
+        return {
+            'length': self.length,
+            'list': list_size,
+            'node': node,
+            'nodes': nodes_size,
+            'values': values_size,
+            'total': list_size + nodes_size + (values_size or 0),
+        }
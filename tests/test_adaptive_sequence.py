@@ -0,0 +1,195 @@
+import unittest
+
+from adaptive_sequence import AdaptiveSequence
+from doubly_linked_list import DoublyLinkedList
+
+
+class AdaptiveSequenceTestCase(unittest.TestCase):
+    def assertSequence(self, sequence, expected):
+        '''
+        Checks the values, head, tail and length against the expected values.
+        '''
+        self.assertEqual(list(sequence), expected)
+        self.assertEqual(len(sequence), len(expected))
+        if expected:
+            self.assertEqual(sequence.head.value, expected[0])
+            self.assertEqual(sequence.tail.value, expected[-1])
+        else:
+            self.assertIsNone(sequence.head)
+            self.assertIsNone(sequence.tail)
+
+
+class TestMigration(AdaptiveSequenceTestCase):
+    def test_queue_workload_migrates_to_linked(self):
+        sequence = AdaptiveSequence(*range(5000), sample_interval=64)
+        for value in range(5000):
+            sequence.append(value)
+            sequence.pop_first()
+        self.assertEqual(sequence.representation, 'linked')
+        self.assertSequence(sequence, list(range(5000)))
+        migration = sequence.stats()['migrations'][0]
+        self.assertEqual((migration['source'], migration['target'], migration['forced']), ('array', 'linked', False))
+
+    def test_indexed_workload_migrates_to_array(self):
+        sequence = AdaptiveSequence(*range(5000), representation='linked', sample_interval=64)
+        for index in range(0, 5000, 7):
+            self.assertEqual(sequence.get(index).value, index)
+        self.assertEqual(sequence.representation, 'array')
+        self.assertSequence(sequence, list(range(5000)))
+        self.assertEqual(sequence.stats()['migrations'][0]['target'], 'array')
+
+    def test_pinned_sequence_does_not_migrate(self):
+        sequence = AdaptiveSequence(*range(5000), adaptive=False, sample_interval=64)
+        for value in range(2000):
+            sequence.prepend(value)
+        self.assertEqual(sequence.representation, 'array')
+        self.assertEqual(sequence.stats()['migrations'], [])
+
+    def test_forced_migration_keeps_nodes(self):
+        sequence = AdaptiveSequence(1, 2, 3)
+        node = sequence.get(1)
+        sequence.migrate('linked')
+        self.assertIs(sequence.get(1), node)
+        sequence.migrate('array')
+        self.assertIs(sequence.get(1), node)
+        self.assertIsNone(node.next)
+        self.assertIsNone(node.prev)
+        self.assertTrue(all(migration['forced'] for migration in sequence.migrations))
+
+    def test_initial_values_are_not_charged(self):
+        sequence = AdaptiveSequence(*range(1000), sample_interval=64)
+        self.assertEqual(sequence.stats()['operations'], 0)
+        self.assertEqual(sequence.stats()['window'], {})
+        self.assertSequence(sequence, list(range(1000)))
+
+    def test_window_counts_pops_separately(self):
+        for representation in AdaptiveSequence.REPRESENTATIONS:
+            with self.subTest(representation=representation):
+                sequence = AdaptiveSequence(1, 2, 3, 4, 5, representation=representation, adaptive=False)
+                sequence.append(6)
+                sequence.prepend(0)
+                sequence.pop_first()
+                sequence.pop()
+                sequence.pop(2)
+                sequence.insert(2, 3)
+                self.assertEqual(sequence.stats()['window'], {
+                    'push_back': 1, 'push_front': 1, 'pop_front': 1, 'pop_back': 1, 'pop': 1, 'insert': 1,
+                })
+
+    def test_queue_migration_window_logs_pops(self):
+        sequence = AdaptiveSequence(*range(5000), sample_interval=64)
+        for value in range(5000):
+            sequence.append(value)
+            sequence.pop_first()
+        window = sequence.stats()['migrations'][0]['window']
+        self.assertEqual(window['pop_front'], window['push_back'])
+
+    def test_unknown_representation(self):
+        with self.assertRaises(ValueError):
+            AdaptiveSequence(representation='tree')
+        with self.assertRaises(ValueError):
+            AdaptiveSequence().migrate('tree')
+
+
+class TestOperations(AdaptiveSequenceTestCase):
+    def test_operations_in_both_representations(self):
+        for representation in AdaptiveSequence.REPRESENTATIONS:
+            with self.subTest(representation=representation):
+                sequence = AdaptiveSequence(1, 2, 3, 4, representation=representation, adaptive=False)
+                sequence.insert(2, 10)
+                sequence.insert(-1, 20)
+                sequence.prepend(0)
+                self.assertSequence(sequence, [0, 1, 2, 10, 3, 4, 20])
+                self.assertEqual(sequence.pop(3).value, 10)
+                self.assertEqual(sequence.pop().value, 20)
+                self.assertEqual(sequence.remove(3).value, 3)
+                sequence.reverse()
+                self.assertSequence(sequence, [4, 2, 1, 0])
+                sequence.reverse_range(1, 3)
+                self.assertSequence(sequence, [4, 1, 2, 0])
+                self.assertEqual(sequence.remove_if(lambda value: value % 2 == 0).length, 3)
+                self.assertSequence(sequence, [1])
+
+    def test_nested_iteration(self):
+        for representation in AdaptiveSequence.REPRESENTATIONS:
+            with self.subTest(representation=representation):
+                sequence = AdaptiveSequence(1, 2, 3, representation=representation)
+                self.assertEqual(len([(a, b) for a in sequence for b in sequence]), 9)
+                values = sequence.unique()
+                self.assertEqual(next(values), 1)
+                self.assertEqual(list(sequence), [1, 2, 3])
+                self.assertEqual(list(values), [2, 3])
+
+    def test_reverse_range_out_of_range(self):
+        for representation in AdaptiveSequence.REPRESENTATIONS:
+            sequence = AdaptiveSequence(1, 2, 3, representation=representation)
+            with self.assertRaises(IndexError):
+                sequence.reverse_range(0, -10)
+
+    def test_discard_many_unhashable_iterator(self):
+        for representation in AdaptiveSequence.REPRESENTATIONS:
+            sequence = AdaptiveSequence(1, [2], 3, 4, representation=representation)
+            self.assertEqual(sequence.discard_many(value for value in [1, [2], 3]), 3)
+            self.assertSequence(sequence, [4])
+
+    def test_access_is_not_charged(self):
+        sequence = AdaptiveSequence(1, 2, 3)
+        operations = sequence.stats()['operations']
+        self.assertEqual(sequence.access(3).value, 3)
+        self.assertEqual(sequence.stats()['operations'], operations)
+        with self.assertRaises(ValueError):
+            sequence.access(5)
+
+
+class TestMemoryUsage(AdaptiveSequenceTestCase):
+    def test_report_adds_up(self):
+        for representation in AdaptiveSequence.REPRESENTATIONS:
+            with self.subTest(representation=representation):
+                report = AdaptiveSequence(1, 2, 3, representation=representation).memory_usage()
+                self.assertEqual(report['representation'], representation)
+                self.assertEqual(report['length'], 3)
+                self.assertEqual(report['nodes'], 3 * report['node']['total'])
+                self.assertIsNone(report['values'])
+                self.assertEqual(report['total'], report['list'] + report['nodes'])
+
+    def test_deep_counts_shared_values_once(self):
+        value = 'x' * 1000
+        for representation in AdaptiveSequence.REPRESENTATIONS:
+            with self.subTest(representation=representation):
+                report = AdaptiveSequence(value, value, representation=representation).memory_usage(deep=True)
+                single = AdaptiveSequence(value, representation=representation).memory_usage(deep=True)
+                self.assertEqual(report['values'], single['values'])
+                self.assertEqual(report['total'], report['list'] + report['nodes'] + report['values'])
+
+
+class TestPolicies(AdaptiveSequenceTestCase):
+    def test_policies_match_doubly_linked_list(self):
+        lookups = [3, 4, 4, 2, 3, 1, 4]
+        for policy in DoublyLinkedList.POLICIES:
+            for representation in AdaptiveSequence.REPRESENTATIONS:
+                with self.subTest(policy=policy, representation=representation):
+                    sequence = AdaptiveSequence(1, 2, 3, 4, representation=representation, policy=policy)
+                    linked_list = DoublyLinkedList(1, 2, 3, 4, policy=policy)
+                    for value in lookups:
+                        self.assertEqual(sequence.access(value).value, linked_list.access(value).value)
+                        self.assertEqual(list(sequence), list(linked_list))
+
+    def test_count_policy_survives_migration(self):
+        sequence = AdaptiveSequence(1, 2, 3, policy='count')
+        sequence.access(3)
+        sequence.access(3)
+        sequence.migrate('linked')
+        sequence.access(2)
+        self.assertSequence(sequence, [3, 2, 1])
+        sequence.migrate('array')
+        sequence.access(1)
+        sequence.access(1)
+        self.assertSequence(sequence, [3, 1, 2])
+
+    def test_unknown_policy(self):
+        with self.assertRaises(ValueError):
+            AdaptiveSequence(policy='random')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,54 @@
+import unittest
+
+from deduplication import BloomFilter, duplicate_checker
+
+
+class TestBloomFilter(unittest.TestCase):
+    def test_no_false_negatives(self):
+        bloom_filter = BloomFilter(1000)
+        for value in range(1000):
+            bloom_filter.add(value)
+        self.assertTrue(all(value in bloom_filter for value in range(1000)))
+
+    def test_add_reports_presence(self):
+        bloom_filter = BloomFilter(10)
+        self.assertFalse(bloom_filter.add('value'))
+        self.assertTrue(bloom_filter.add('value'))
+
+    def test_false_positive_rate(self):
+        bloom_filter = BloomFilter(10000, error_rate=0.01)
+        for value in range(10000):
+            bloom_filter.add(value)
+        false_positives = sum(value in bloom_filter for value in range(10000, 30000))
+        self.assertLess(false_positives / 20000, 0.03)
+
+    def test_max_bytes_bounds_bit_array(self):
+        bloom_filter = BloomFilter(100000, error_rate=0.001, max_bytes=256)
+        self.assertLessEqual(len(bloom_filter.bits), 256)
+        self.assertGreater(bloom_filter.estimated_error_rate(100000), 0.001)
+
+    def test_equal_hashes_always_collide(self):
+        bloom_filter = BloomFilter(10, error_rate=1e-9)
+        bloom_filter.add(-1)
+        self.assertIn(-2, bloom_filter)
+
+    def test_invalid_settings(self):
+        for kwargs in ({'capacity': -1}, {'capacity': 10, 'error_rate': 0}, {'capacity': 10, 'error_rate': 1},
+                       {'capacity': 10, 'max_bytes': 0}):
+            with self.subTest(**kwargs):
+                with self.assertRaises(ValueError):
+                    BloomFilter(**kwargs)
+
+
+class TestDuplicateChecker(unittest.TestCase):
+    def test_exact_with_key(self):
+        is_duplicate = duplicate_checker(10, key=str.lower)
+        self.assertEqual([is_duplicate(value) for value in ['a', 'A', 'b', 'a']], [False, True, False, True])
+
+    def test_approximate_with_key(self):
+        is_duplicate = duplicate_checker(10, key=abs, approximate=True)
+        self.assertEqual([is_duplicate(value) for value in [3, -3, 4]], [False, True, False])
+
+
+if __name__ == '__main__':
+    unittest.main()
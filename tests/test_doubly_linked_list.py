@@ -0,0 +1,296 @@
+import unittest
+
+from doubly_linked_list import DoublyLinkedList
+
+
+def backward_values(linked_list):
+    '''
+    Returns the values of the linked list, walked from tail to head through the prev references.
+    '''
+    values = []
+    current = linked_list.tail
+    while current:
+        values.append(current.value)
+        current = current.next if linked_list._reversed else current.prev
+    return values
+
+
+class DoublyLinkedListTestCase(unittest.TestCase):
+    def assertChain(self, linked_list, expected):
+        '''
+        Checks the values in both directions, head, tail and length against the expected values.
+        '''
+        self.assertEqual(list(linked_list), expected)
+        self.assertEqual(backward_values(linked_list), expected[::-1])
+        self.assertEqual(len(linked_list), len(expected))
+        if expected:
+            self.assertEqual(linked_list.head.value, expected[0])
+            self.assertEqual(linked_list.tail.value, expected[-1])
+        else:
+            self.assertIsNone(linked_list.head)
+            self.assertIsNone(linked_list.tail)
+
+
+class TestReverse(DoublyLinkedListTestCase):
+    def test_reverse_swaps_head_and_tail(self):
+        linked_list = DoublyLinkedList(1, 2, 3)
+        linked_list.reverse()
+        self.assertChain(linked_list, [3, 2, 1])
+        self.assertEqual(str(linked_list), 'Node(3) <=> Node(2) <=> Node(1)')
+
+    def test_reverse_twice_restores_order(self):
+        linked_list = DoublyLinkedList(1, 2, 3)
+        linked_list.reverse()
+        linked_list.reverse()
+        self.assertChain(linked_list, [1, 2, 3])
+
+    def test_get_after_reverse(self):
+        linked_list = DoublyLinkedList(1, 2, 3, 4, 5)
+        linked_list.reverse()
+        self.assertEqual([linked_list.get(i).value for i in range(5)], [5, 4, 3, 2, 1])
+        self.assertEqual(linked_list.get(-1).value, 1)
+        self.assertEqual(linked_list.find(4), 1)
+
+    def test_append_and_prepend_after_reverse(self):
+        linked_list = DoublyLinkedList(1, 2, 3)
+        linked_list.reverse()
+        linked_list.append(0)
+        linked_list.prepend(4)
+        self.assertChain(linked_list, [4, 3, 2, 1, 0])
+
+    def test_insert_after_reverse(self):
+        linked_list = DoublyLinkedList(1, 2, 3, 4)
+        linked_list.reverse()
+        linked_list.insert(1, 10)
+        linked_list.insert(-1, 20)
+        linked_list.insert(0, 30)
+        self.assertChain(linked_list, [30, 4, 10, 3, 2, 1, 20])
+
+    def test_pop_after_reverse(self):
+        linked_list = DoublyLinkedList(1, 2, 3, 4)
+        linked_list.reverse()
+        self.assertEqual(linked_list.pop_first().value, 4)
+        self.assertEqual(linked_list.pop().value, 1)
+        self.assertEqual(linked_list.pop(0).value, 3)
+        self.assertChain(linked_list, [2])
+
+    def test_nested_iteration(self):
+        linked_list = DoublyLinkedList(1, 2)
+        self.assertEqual([(a, b) for a in linked_list for b in linked_list], [(1, 1), (1, 2), (2, 1), (2, 2)])
+        linked_list.reverse()
+        self.assertEqual([(a, b) for a in linked_list for b in linked_list], [(2, 2), (2, 1), (1, 2), (1, 1)])
+        self.assertNotIn('current', vars(linked_list))
+
+    def test_reverse_empty_list(self):
+        linked_list = DoublyLinkedList()
+        linked_list.reverse()
+        linked_list.append(1)
+        self.assertChain(linked_list, [1])
+
+    def test_reversed_copy(self):
+        linked_list = DoublyLinkedList(1, 2, 3)
+        copy = linked_list.reversed_copy()
+        self.assertChain(copy, [3, 2, 1])
+        self.assertChain(linked_list, [1, 2, 3])
+        self.assertIsNot(copy.head, linked_list.tail)
+
+
+class TestReverseRange(DoublyLinkedListTestCase):
+    def test_reverse_middle(self):
+        linked_list = DoublyLinkedList(1, 2, 3, 4, 5)
+        linked_list.reverse_range(1, 4)
+        self.assertChain(linked_list, [1, 4, 3, 2, 5])
+
+    def test_reverse_whole_list(self):
+        linked_list = DoublyLinkedList(1, 2, 3)
+        linked_list.reverse_range(0, 3)
+        self.assertChain(linked_list, [3, 2, 1])
+
+    def test_reverse_range_on_reversed_list(self):
+        linked_list = DoublyLinkedList(1, 2, 3, 4, 5)
+        linked_list.reverse()
+        linked_list.reverse_range(0, 2)
+        self.assertChain(linked_list, [4, 5, 3, 2, 1])
+        linked_list.reverse_range(-2, 5)
+        self.assertChain(linked_list, [4, 5, 3, 1, 2])
+
+    def test_empty_range_is_a_no_op(self):
+        linked_list = DoublyLinkedList(1, 2, 3)
+        linked_list.reverse_range(1, 1)
+        self.assertChain(linked_list, [1, 2, 3])
+
+    def test_out_of_range(self):
+        linked_list = DoublyLinkedList(1, 2, 3)
+        with self.assertRaises(IndexError):
+            linked_list.reverse_range(0, 4)
+        with self.assertRaises(IndexError):
+            linked_list.reverse_range(0, -10)
+        with self.assertRaises(IndexError):
+            linked_list.reverse_range(4, 4)
+
+    def test_start_after_stop(self):
+        linked_list = DoublyLinkedList(1, 2, 3)
+        with self.assertRaises(ValueError):
+            linked_list.reverse_range(2, 1)
+
+
+class TestMemoryUsage(DoublyLinkedListTestCase):
+    def test_report_adds_up(self):
+        report = DoublyLinkedList(1, 2, 3).memory_usage()
+        self.assertEqual(report['length'], 3)
+        self.assertEqual(report['nodes'], 3 * report['node']['total'])
+        self.assertIsNone(report['values'])
+        self.assertEqual(report['total'], report['list'] + report['nodes'])
+
+    def test_deep_counts_shared_values_once(self):
+        value = 'x' * 1000
+        report = DoublyLinkedList(value, value).memory_usage(deep=True)
+        single = DoublyLinkedList(value).memory_usage(deep=True)
+        self.assertEqual(report['values'], single['values'])
+
+    def test_deep_report_on_reversed_list(self):
+        linked_list = DoublyLinkedList('a' * 100, 'b' * 200)
+        report = linked_list.memory_usage(deep=True)
+        linked_list.reverse()
+        self.assertEqual(linked_list.memory_usage(deep=True)['values'], report['values'])
+
+
+class TestBulkRemoval(DoublyLinkedListTestCase):
+    def test_remove_if_keeps_head_and_tail(self):
+        linked_list = DoublyLinkedList(2, 1, 4, 3, 6)
+        removed = linked_list.remove_if(lambda value: value % 2 == 0)
+        self.assertChain(linked_list, [1, 3])
+        self.assertChain(removed, [2, 4, 6])
+
+    def test_remove_if_on_reversed_list(self):
+        linked_list = DoublyLinkedList(1, 2, 3, 4, 5)
+        linked_list.reverse()
+        removed = linked_list.remove_if(lambda value: value in (5, 3, 1))
+        self.assertChain(linked_list, [4, 2])
+        self.assertChain(removed, [5, 3, 1])
+        linked_list.append(0)
+        self.assertChain(linked_list, [4, 2, 0])
+
+    def test_remove_if_everything(self):
+        linked_list = DoublyLinkedList(1, 2)
+        linked_list.remove_if(lambda value: True)
+        self.assertChain(linked_list, [])
+
+    def test_remove_all_and_discard_many(self):
+        linked_list = DoublyLinkedList(1, 2, 1, 3, 4)
+        self.assertEqual(linked_list.remove_all(1), 2)
+        self.assertEqual(linked_list.discard_many(iter([4, [5], 2])), 2)
+        self.assertChain(linked_list, [3])
+
+
+class TestDeduplication(DoublyLinkedListTestCase):
+    def test_remove_duplicates(self):
+        linked_list = DoublyLinkedList(1, 2, 1, 3, 2, 3)
+        self.assertEqual(linked_list.remove_duplicates(), 3)
+        self.assertChain(linked_list, [1, 2, 3])
+
+    def test_remove_duplicates_on_reversed_list(self):
+        linked_list = DoublyLinkedList(1, 2, 2, 3, 1)
+        linked_list.reverse()
+        self.assertEqual(linked_list.remove_duplicates(), 2)
+        self.assertChain(linked_list, [1, 3, 2])
+
+    def test_remove_duplicates_with_key(self):
+        linked_list = DoublyLinkedList('a', 'B', 'A', 'b', 'c')
+        self.assertEqual(linked_list.remove_duplicates(key=str.lower), 2)
+        self.assertChain(linked_list, ['a', 'B', 'c'])
+
+    def test_invalid_bloom_filter_settings(self):
+        linked_list = DoublyLinkedList(1, 2)
+        with self.assertRaises(ValueError):
+            linked_list.remove_duplicates(approximate=True, error_rate=1)
+        with self.assertRaises(ValueError):
+            linked_list.remove_duplicates(approximate=True, max_bytes=-1)
+        self.assertChain(linked_list, [1, 2])
+
+    def test_unique_does_not_modify_list(self):
+        linked_list = DoublyLinkedList(3, 1, 3, 2, 1)
+        linked_list.reverse()
+        self.assertEqual(list(linked_list.unique()), [1, 2, 3])
+        self.assertChain(linked_list, [1, 2, 3, 1, 3])
+
+
+class TestPolicies(DoublyLinkedListTestCase):
+    def test_static_list_is_not_reordered(self):
+        linked_list = DoublyLinkedList(1, 2, 3)
+        self.assertEqual(linked_list.find(3), 2)
+        self.assertIs(linked_list.access(3), linked_list.tail)
+        self.assertChain(linked_list, [1, 2, 3])
+
+    def test_move_to_front(self):
+        linked_list = DoublyLinkedList(1, 2, 3, 4, policy='move_to_front')
+        self.assertEqual(linked_list.find(3), 2)
+        self.assertChain(linked_list, [3, 1, 2, 4])
+        self.assertEqual(linked_list.access(4).value, 4)
+        self.assertChain(linked_list, [4, 3, 1, 2])
+
+    def test_transpose(self):
+        linked_list = DoublyLinkedList(1, 2, 3, 4, policy='transpose')
+        self.assertIn(4, linked_list)
+        self.assertChain(linked_list, [1, 2, 4, 3])
+        linked_list.access(2)
+        self.assertChain(linked_list, [2, 1, 4, 3])
+        linked_list.access(2)
+        self.assertChain(linked_list, [2, 1, 4, 3])
+
+    def test_count(self):
+        linked_list = DoublyLinkedList(1, 2, 3, 4, policy='count')
+        linked_list.access(3)
+        self.assertChain(linked_list, [3, 1, 2, 4])
+        linked_list.access(4)
+        self.assertChain(linked_list, [3, 4, 1, 2])
+        linked_list.access(4)
+        self.assertChain(linked_list, [4, 3, 1, 2])
+        linked_list.access(2)
+        self.assertChain(linked_list, [4, 3, 2, 1])
+
+    def test_missing_value(self):
+        linked_list = DoublyLinkedList(1, 2, policy='move_to_front')
+        self.assertEqual(linked_list.find(5), -1)
+        self.assertNotIn(5, linked_list)
+        with self.assertRaises(ValueError):
+            linked_list.access(5)
+        self.assertChain(linked_list, [1, 2])
+
+    def test_removal_forgets_access_counts(self):
+        linked_list = DoublyLinkedList(1, 2, 3, policy='count')
+        linked_list.access(2)
+        linked_list.access(3)
+        linked_list.pop_first()
+        linked_list.remove_if(lambda value: value == 2)
+        self.assertEqual(list(linked_list._access_counts.values()), [1])
+
+    def test_unknown_policy(self):
+        with self.assertRaises(ValueError):
+            DoublyLinkedList(policy='random')
+
+
+class TestPopAndRemove(DoublyLinkedListTestCase):
+    def test_pop(self):
+        linked_list = DoublyLinkedList(1, 2, 3, 4)
+        self.assertEqual(linked_list.pop().value, 4)
+        self.assertEqual(linked_list.pop(1).value, 2)
+        self.assertChain(linked_list, [1, 3])
+        with self.assertRaises(IndexError):
+            linked_list.pop(5)
+
+    def test_pop_empty(self):
+        with self.assertRaises(IndexError):
+            DoublyLinkedList().pop()
+
+    def test_remove(self):
+        linked_list = DoublyLinkedList(1, 2, 3)
+        linked_list.reverse()
+        self.assertEqual(linked_list.remove(1).value, 1)
+        self.assertChain(linked_list, [3, 2])
+        with self.assertRaises(ValueError):
+            linked_list.remove(1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,262 @@
+import unittest
+
+from memory_profiling import AllocationProfiler
+from singly_linked_list import LinkedList
+
+
+class LinkedListTestCase(unittest.TestCase):
+    def assertChain(self, linked_list, expected):
+        '''
+        Checks the values, head, tail and length against the expected values.
+        '''
+        self.assertEqual(list(linked_list), expected)
+        self.assertEqual(len(linked_list), len(expected))
+        if expected:
+            self.assertEqual(linked_list.head.value, expected[0])
+            self.assertEqual(linked_list.tail.value, expected[-1])
+            self.assertIsNone(linked_list.tail.next)
+        else:
+            self.assertIsNone(linked_list.head)
+            self.assertIsNone(linked_list.tail)
+
+
+class TestReverse(LinkedListTestCase):
+    def test_reverse(self):
+        linked_list = LinkedList(1, 2, 3)
+        linked_list.reverse()
+        self.assertChain(linked_list, [3, 2, 1])
+        linked_list.append(0)
+        self.assertChain(linked_list, [3, 2, 1, 0])
+
+    def test_reversed_copy(self):
+        linked_list = LinkedList(1, 2, 3)
+        copy = linked_list.reversed_copy()
+        self.assertChain(copy, [3, 2, 1])
+        self.assertChain(linked_list, [1, 2, 3])
+
+
+class TestReverseRange(LinkedListTestCase):
+    def test_reverse_middle(self):
+        linked_list = LinkedList(1, 2, 3, 4, 5)
+        linked_list.reverse_range(1, 4)
+        self.assertChain(linked_list, [1, 4, 3, 2, 5])
+
+    def test_reverse_prefix_updates_head(self):
+        linked_list = LinkedList(1, 2, 3, 4)
+        linked_list.reverse_range(0, 2)
+        self.assertChain(linked_list, [2, 1, 3, 4])
+
+    def test_reverse_suffix_updates_tail(self):
+        linked_list = LinkedList(1, 2, 3, 4)
+        linked_list.reverse_range(-2, 4)
+        self.assertChain(linked_list, [1, 2, 4, 3])
+
+    def test_out_of_range(self):
+        linked_list = LinkedList(1, 2, 3)
+        with self.assertRaises(IndexError):
+            linked_list.reverse_range(0, 4)
+        with self.assertRaises(IndexError):
+            linked_list.reverse_range(0, -10)
+
+    def test_start_after_stop(self):
+        linked_list = LinkedList(1, 2, 3)
+        with self.assertRaises(ValueError):
+            linked_list.reverse_range(2, 1)
+
+
+class TestMemoryUsage(LinkedListTestCase):
+    def test_report_adds_up(self):
+        report = LinkedList(1, 2, 3).memory_usage()
+        self.assertEqual(report['length'], 3)
+        self.assertEqual(report['nodes'], 3 * report['node']['total'])
+        self.assertIsNone(report['values'])
+        self.assertEqual(report['total'], report['list'] + report['nodes'])
+
+    def test_deep_counts_shared_values_once(self):
+        value = 'x' * 1000
+        report = LinkedList(value, value).memory_usage(deep=True)
+        single = LinkedList(value).memory_usage(deep=True)
+        self.assertEqual(report['values'], single['values'])
+
+    def test_profiler_attributes_allocations_to_methods(self):
+        linked_list = LinkedList()
+        with AllocationProfiler(linked_list) as profiler:
+            for value in range(100):
+                linked_list.append(value)
+            list(linked_list.unique())
+        self.assertEqual(profiler.stats['append']['calls'], 100)
+        self.assertGreater(profiler.stats['append']['allocated'], 0)
+        self.assertNotIn('unique', profiler.stats)
+        self.assertNotIn('append', vars(linked_list))
+
+
+class TestBulkRemoval(LinkedListTestCase):
+    def test_remove_if_keeps_head_and_tail(self):
+        linked_list = LinkedList(2, 1, 4, 3, 6)
+        removed = linked_list.remove_if(lambda value: value % 2 == 0)
+        self.assertChain(linked_list, [1, 3])
+        self.assertChain(removed, [2, 4, 6])
+
+    def test_remove_if_everything(self):
+        linked_list = LinkedList(1, 2)
+        linked_list.remove_if(lambda value: True)
+        self.assertChain(linked_list, [])
+        linked_list.append(3)
+        self.assertChain(linked_list, [3])
+
+    def test_remove_if_reuses_nodes(self):
+        linked_list = LinkedList(1, 2, 3)
+        node = linked_list.get(1)
+        removed = linked_list.remove_if(lambda value: value == 2)
+        self.assertIs(removed.head, node)
+
+    def test_remove_all(self):
+        linked_list = LinkedList(1, 2, 1, 1)
+        self.assertEqual(linked_list.remove_all(1), 3)
+        self.assertChain(linked_list, [2])
+
+    def test_discard_many(self):
+        linked_list = LinkedList(1, 2, 3, 4)
+        self.assertEqual(linked_list.discard_many([4, 1, 9]), 2)
+        self.assertChain(linked_list, [2, 3])
+
+    def test_discard_many_unhashable_iterator(self):
+        linked_list = LinkedList(1, [2], 3, 4)
+        self.assertEqual(linked_list.discard_many(value for value in [1, [2], 3]), 3)
+        self.assertChain(linked_list, [4])
+
+    def test_remove_last_updates_tail(self):
+        linked_list = LinkedList(1, 2, 3)
+        self.assertEqual(linked_list.remove(3).value, 3)
+        self.assertChain(linked_list, [1, 2])
+        with self.assertRaises(ValueError):
+            linked_list.remove(3)
+
+
+class TestDeduplication(LinkedListTestCase):
+    def test_remove_duplicates(self):
+        linked_list = LinkedList(1, 2, 1, 3, 2, 3)
+        self.assertEqual(linked_list.remove_duplicates(), 3)
+        self.assertChain(linked_list, [1, 2, 3])
+        linked_list.append(4)
+        self.assertChain(linked_list, [1, 2, 3, 4])
+
+    def test_remove_duplicates_at_tail(self):
+        linked_list = LinkedList(1, 2, 2, 1)
+        self.assertEqual(linked_list.remove_duplicates(), 2)
+        self.assertChain(linked_list, [1, 2])
+
+    def test_remove_duplicates_with_key(self):
+        linked_list = LinkedList('a', 'B', 'A', 'b', 'c')
+        self.assertEqual(linked_list.remove_duplicates(key=str.lower), 2)
+        self.assertChain(linked_list, ['a', 'B', 'c'])
+
+    def test_remove_duplicates_approximate(self):
+        linked_list = LinkedList(*range(100), *range(100))
+        self.assertGreaterEqual(linked_list.remove_duplicates(approximate=True), 100)
+        self.assertEqual(list(linked_list)[:10], list(range(10)))
+        self.assertEqual(len(linked_list), linked_list.length)
+
+    def test_remove_duplicates_from_empty_list(self):
+        with self.assertRaises(RuntimeError):
+            LinkedList().remove_duplicates()
+
+    def test_invalid_bloom_filter_settings(self):
+        linked_list = LinkedList(1, 2)
+        with self.assertRaises(ValueError):
+            linked_list.remove_duplicates(approximate=True, error_rate=0)
+        with self.assertRaises(ValueError):
+            linked_list.remove_duplicates(approximate=True, error_rate=1.5)
+        with self.assertRaises(ValueError):
+            linked_list.remove_duplicates(approximate=True, max_bytes=0)
+        self.assertChain(linked_list, [1, 2])
+
+    def test_unique_does_not_modify_list(self):
+        linked_list = LinkedList('a', 'B', 'A', 'b', 'c')
+        self.assertEqual(list(linked_list.unique(key=str.lower)), ['a', 'B', 'c'])
+        self.assertChain(linked_list, ['a', 'B', 'A', 'b', 'c'])
+
+
+class TestPolicies(LinkedListTestCase):
+    def test_static_list_is_not_reordered(self):
+        linked_list = LinkedList(1, 2, 3)
+        self.assertEqual(linked_list.find(3), 2)
+        self.assertIs(linked_list.access(3), linked_list.tail)
+        self.assertChain(linked_list, [1, 2, 3])
+
+    def test_move_to_front(self):
+        linked_list = LinkedList(1, 2, 3, 4, policy='move_to_front')
+        self.assertEqual(linked_list.find(3), 2)
+        self.assertChain(linked_list, [3, 1, 2, 4])
+        self.assertEqual(linked_list.access(4).value, 4)
+        self.assertChain(linked_list, [4, 3, 1, 2])
+
+    def test_transpose(self):
+        linked_list = LinkedList(1, 2, 3, 4, policy='transpose')
+        self.assertIn(4, linked_list)
+        self.assertChain(linked_list, [1, 2, 4, 3])
+        linked_list.access(2)
+        self.assertChain(linked_list, [2, 1, 4, 3])
+        linked_list.access(2)
+        self.assertChain(linked_list, [2, 1, 4, 3])
+
+    def test_count(self):
+        linked_list = LinkedList(1, 2, 3, 4, policy='count')
+        linked_list.access(3)
+        self.assertChain(linked_list, [3, 1, 2, 4])
+        linked_list.access(4)
+        self.assertChain(linked_list, [3, 4, 1, 2])
+        linked_list.access(4)
+        self.assertChain(linked_list, [4, 3, 1, 2])
+        linked_list.access(2)
+        self.assertChain(linked_list, [4, 3, 2, 1])
+
+    def test_count_after_prepend(self):
+        linked_list = LinkedList(1, 2, policy='count')
+        linked_list.access(2)
+        linked_list.access(2)
+        linked_list.prepend(3)
+        linked_list.access(1)
+        self.assertChain(linked_list, [3, 2, 1])
+
+    def test_count_after_reverse(self):
+        linked_list = LinkedList('c', 'a', 'b', 'd', policy='count')
+        for value, lookups in (('d', 10), ('c', 4), ('b', 1)):
+            for _ in range(lookups):
+                linked_list.access(value)
+        self.assertChain(linked_list, ['d', 'c', 'b', 'a'])
+        linked_list.reverse_range(1, 4)
+        self.assertChain(linked_list, ['d', 'a', 'b', 'c'])
+        linked_list.access('b')
+        self.assertChain(linked_list, ['d', 'b', 'a', 'c'])
+        linked_list.access('c')
+        self.assertChain(linked_list, ['d', 'c', 'b', 'a'])
+        linked_list.reverse()
+        linked_list.access('a')
+        self.assertChain(linked_list, ['a', 'b', 'c', 'd'])
+        linked_list.access('d')
+        self.assertChain(linked_list, ['d', 'a', 'b', 'c'])
+
+    def test_missing_value(self):
+        linked_list = LinkedList(1, 2, policy='move_to_front')
+        self.assertEqual(linked_list.find(5), -1)
+        self.assertNotIn(5, linked_list)
+        with self.assertRaises(ValueError):
+            linked_list.access(5)
+        self.assertChain(linked_list, [1, 2])
+
+    def test_removal_forgets_access_counts(self):
+        linked_list = LinkedList(1, 2, 3, policy='count')
+        linked_list.access(2)
+        linked_list.access(3)
+        linked_list.pop_first()
+        linked_list.remove_if(lambda value: value == 2)
+        self.assertEqual(list(linked_list._access_counts.values()), [1])
+
+    def test_unknown_policy(self):
+        with self.assertRaises(ValueError):
+            LinkedList(policy='random')
+
+
+if __name__ == '__main__':
+    unittest.main()